@@ -11,7 +11,7 @@ import gc
 import asyncio
 import time
 
-from app.utils import load_pdf_ultra_fast, cleanup_temp_files
+from app.utils import load_pdf_ultra_fast, cleanup_temp_files, setup_ingest_logging
 from app.qa_chain import get_ultra_fast_qa_chain, cleanup_client, get_weaviate_client, get_embeddings, get_llm
 from weaviate.classes.query import HybridFusion
 
@@ -435,6 +435,7 @@ async def health_check():
 
 @app.on_event("startup")
 async def startup_event():
+    setup_ingest_logging()
     print("✅ RAG Backend started successfully (reranking disabled)")
 
 @app.on_event("shutdown")
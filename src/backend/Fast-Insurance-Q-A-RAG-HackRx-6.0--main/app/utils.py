@@ -6,14 +6,19 @@ Supports PDF, DOCX, and Email processing with semantic similarity-based chunking
 import os
 import re
 import json
+import logging
+import logging.handlers
+import queue
 import tempfile
 import asyncio
 import traceback
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
 import httpx
+import numpy as np
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from langchain_community.document_loaders import PyPDFLoader
@@ -45,6 +50,56 @@ VOYAGE_API_KEY = os.getenv("VOYAGE_API_KEY")
 if not VOYAGE_API_KEY:
     raise ValueError("VOYAGE_API_KEY not found in environment")
 
+logger = logging.getLogger("verdicto.ingest")
+_log_listener = None
+
+
+def setup_ingest_logging(level: int = logging.INFO):
+    """Route ingest logs through a queue so request handlers only enqueue.
+
+    Formatting and the stderr write happen on the listener's background thread
+    instead of inside the request path. Safe to call more than once.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
+    )
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    return _log_listener
+
+
+def _has_min_content(text: str, min_chars: int = 10, min_tokens: int = 2) -> bool:
+    """Single-pass check that text is long enough and has enough tokens.
+
+    Equivalent to `len(text.strip()) > min_chars and len(text.split()) > min_tokens`
+    but without allocating the stripped copy's token list - it short-circuits as
+    soon as enough tokens are seen, which matters when filtering thousands of chunks.
+    """
+    stripped = text.strip()
+    if len(stripped) <= min_chars:
+        return False
+
+    tokens = 0
+    in_token = False
+    for ch in stripped:
+        if ch.isspace():
+            in_token = False
+        elif not in_token:
+            in_token = True
+            tokens += 1
+            if tokens > min_tokens:
+                return True
+    return False
+
 
 def extract_pdf_preview(file_path: str) -> str:
     """Extract first 50 words from PDF for preview"""
@@ -153,26 +208,40 @@ def detect_file_type(file_path: str) -> str:
         return 'unknown'
 
 
+# Voyage accepts up to 128 texts per embeddings request
+VOYAGE_BATCH_SIZE = 128
+
+
 async def get_embeddings(texts: List[str], model: str = "voyage-3-large") -> List[List[float]]:
-    """Get embeddings from Voyage AI API"""
+    """Get embeddings from Voyage AI API, batching large inputs concurrently"""
     if not VOYAGE_API_KEY:
         raise ValueError("VOYAGE_API_KEY not found in environment")
 
     async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            "https://api.voyageai.com/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {VOYAGE_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "input": texts,
-                "model": model
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return [item["embedding"] for item in data]
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            response = await client.post(
+                "https://api.voyageai.com/v1/embeddings",
+                headers={
+                    "Authorization": f"Bearer {VOYAGE_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "input": batch,
+                    "model": model
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            return [item["embedding"] for item in data]
+
+        batches = [
+            texts[i:i + VOYAGE_BATCH_SIZE]
+            for i in range(0, len(texts), VOYAGE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+    return [embedding for batch_result in results for embedding in batch_result]
 
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -211,16 +280,23 @@ async def calculate_semantic_scores(chunks: List[Document], query: str = None) -
 
     try:
         embeddings = await get_embeddings(all_texts)
-        query_embedding = embeddings[0]
-        chunk_embeddings = embeddings[1:]
 
-        # Calculate similarity scores
-        scores = []
-        for chunk_embedding in chunk_embeddings:
-            similarity = cosine_similarity(query_embedding, chunk_embedding)
-            scores.append(max(similarity, 0.0))  # Ensure non-negative
+        # One normalized matmul instead of a Python-level dot product per chunk
+        query_vec = np.asarray(embeddings[0], dtype=np.float32)
+        chunk_matrix = np.asarray(embeddings[1:], dtype=np.float32)
+
+        query_norm = np.linalg.norm(query_vec)
+        chunk_norms = np.linalg.norm(chunk_matrix, axis=1)
+
+        if query_norm == 0:
+            return [0.0] * len(chunk_matrix)
 
-        return scores
+        # Guard zero-norm chunks so the division stays finite
+        safe_norms = np.where(chunk_norms == 0, 1.0, chunk_norms)
+        scores = (chunk_matrix @ query_vec) / (safe_norms * query_norm)
+        scores = np.where(chunk_norms == 0, 0.0, scores)
+
+        return np.maximum(scores, 0.0).tolist()  # Ensure non-negative
 
     except Exception as e:
         # Fallback to basic text length scoring
@@ -526,7 +602,7 @@ class UniversalDocumentSplitter:
 
     def _has_sufficient_context(self, text: str) -> bool:
         """Check if chunk has sufficient context"""
-        return len(text.strip()) > 10 and len(text.split()) > 2
+        return _has_min_content(text)
 
     def _fallback_split(self, document: Document) -> List[Document]:
         """Fallback splitting when no sections are detected"""
@@ -637,6 +713,16 @@ def load_email_document(file_path: str) -> List[Document]:
         raise Exception(f"Failed to load email: {str(e)}")
 
 
+@lru_cache(maxsize=32)
+def _cached_splitter(chunk_size: int, chunk_overlap: int, doc_type: str) -> UniversalDocumentSplitter:
+    """Share splitter instances; they hold only configuration, so reuse is safe"""
+    return UniversalDocumentSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        doc_type=doc_type
+    )
+
+
 def get_smart_splitter(content_length: int, doc_type: str = 'general') -> UniversalDocumentSplitter:
     """Get document splitter with size-based parameters"""
     if content_length > 100000:  # Very large documents
@@ -652,11 +738,7 @@ def get_smart_splitter(content_length: int, doc_type: str = 'general') -> Univer
     else:
         chunk_size, chunk_overlap = 1500, 200
 
-    return UniversalDocumentSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        doc_type=doc_type
-    )
+    return _cached_splitter(chunk_size, chunk_overlap, doc_type)
 
 
 async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query: str = None) -> List[Document]:
@@ -667,7 +749,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
     try:
         # Handle URL downloads
         if path_or_url.startswith(("http://", "https://")):
-            print(f"Processing document from URL: {path_or_url}")
+            logger.info("Processing document from URL: %s", path_or_url)
 
             async with httpx.AsyncClient(
                 timeout=httpx.Timeout(60.0),
@@ -687,7 +769,9 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
                     url_path = Path(path_or_url)
                     extension = url_path.suffix or '.txt'
 
-                file_path = Path(tempfile.mkstemp(suffix=extension)[1])
+                fd, temp_path = tempfile.mkstemp(suffix=extension)
+                os.close(fd)
+                file_path = Path(temp_path)
                 with open(file_path, "wb") as f:
                     f.write(response.content)
                 temp_download = True
@@ -698,7 +782,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
 
         # Detect file type
         file_type = detect_file_type(str(file_path))
-        print(f"Detected file type: {file_type}")
+        logger.debug("Detected file type: %s", file_type)
 
         def load_and_split():
             try:
@@ -710,7 +794,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
 
                     # Extract and print preview
                     preview = extract_pdf_preview(str(file_path))
-                    print(f"Document preview: {preview}")
+                    logger.debug("Document preview: %s", preview)
 
                 elif file_type == 'docx':
                     raw_docs = load_docx_document(str(file_path))
@@ -718,7 +802,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
 
                     # Extract and print preview
                     preview = extract_docx_preview(str(file_path))
-                    print(f"Document preview: {preview}")
+                    logger.debug("Document preview: %s", preview)
 
                 elif file_type == 'email':
                     raw_docs = load_email_document(str(file_path))
@@ -728,7 +812,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                         email_content = f.read()
                     preview = extract_email_preview(email_content)
-                    print(f"Email preview: {preview}")
+                    logger.debug("Email preview: %s", preview)
 
                 else:
                     # Fallback to text loading
@@ -741,7 +825,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
 
                     words = content.strip().split()[:50]
                     preview = ' '.join(words) + ('...' if len(content.split()) > 50 else '')
-                    print(f"Document preview: {preview}")
+                    logger.debug("Document preview: %s", preview)
 
                 if not raw_docs:
                     raise Exception(f"No content extracted from {file_type} file")
@@ -753,8 +837,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
                 # Filter minimal content
                 filtered_docs = [
                     doc for doc in raw_docs
-                    if len(doc.page_content.strip()) > 20
-                    and doc.page_content.strip().count(' ') > 3
+                    if _has_min_content(doc.page_content, min_chars=20, min_tokens=3)
                 ]
 
                 if not filtered_docs:
@@ -770,7 +853,7 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
                 # Filter chunks
                 semantic_filtered = [
                     doc for doc in split_docs
-                    if len(doc.page_content.strip()) > 10 and len(doc.page_content.split()) > 2
+                    if _has_min_content(doc.page_content)
                 ]
 
                 return semantic_filtered
@@ -791,11 +874,8 @@ async def load_document_semantic(path_or_url: str, max_chunks: int = 100, query:
 
     finally:
         # Clean up temporary files
-        if temp_download and file_path and file_path.exists():
-            try:
-                os.remove(file_path)
-            except:
-                pass
+        if temp_download and file_path:
+            file_path.unlink(missing_ok=True)
 
 
 # Specific loader functions for different document types
@@ -804,7 +884,7 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
     temp_download = False
 
     if path_or_url.startswith(("http://", "https://")):
-        print(f"Processing PDF from URL: {path_or_url}")
+        logger.info("Processing PDF from URL: %s", path_or_url)
 
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(60.0),
@@ -813,7 +893,9 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
             response = await client.get(path_or_url, follow_redirects=True)
             response.raise_for_status()
 
-            file_path = Path(tempfile.mkstemp(suffix=".pdf")[1])
+            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+            os.close(fd)
+            file_path = Path(temp_path)
             with open(file_path, "wb") as f:
                 f.write(response.content)
             temp_download = True
@@ -824,7 +906,7 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
 
     # Extract and print document preview
     doc_preview = await run_in_threadpool(extract_pdf_preview, str(file_path))
-    print(f"PDF preview: {doc_preview}")
+    logger.debug("PDF preview: %s", doc_preview)
 
     def load_and_split():
         try:
@@ -841,8 +923,7 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
             # Filter documents
             filtered_docs = [
                 doc for doc in raw_docs
-                if len(doc.page_content.strip()) > 20
-                and doc.page_content.strip().count(' ') > 3
+                if _has_min_content(doc.page_content, min_chars=20, min_tokens=3)
             ]
 
             if not filtered_docs:
@@ -856,7 +937,7 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
             # Filter chunks
             semantic_filtered = [
                 doc for doc in split_docs
-                if len(doc.page_content.strip()) > 10 and len(doc.page_content.split()) > 2
+                if _has_min_content(doc.page_content)
             ]
 
             return semantic_filtered
@@ -865,13 +946,11 @@ async def load_pdf_semantic(path_or_url: str, max_chunks: int = 100, query: str
             error_details = traceback.format_exc()
             raise Exception(f"PDF processing failed for {file_path}: {str(e)}") from e
 
-    split_docs = await run_in_threadpool(load_and_split)
-
-    if temp_download and file_path.exists():
-        try:
-            os.remove(file_path)
-        except:
-            pass
+    try:
+        split_docs = await run_in_threadpool(load_and_split)
+    finally:
+        if temp_download:
+            file_path.unlink(missing_ok=True)
 
     if not split_docs:
         raise Exception("No content extracted from PDF")
@@ -886,7 +965,7 @@ async def load_docx_semantic(path_or_url: str, max_chunks: int = 100, query: str
     temp_download = False
 
     if path_or_url.startswith(("http://", "https://")):
-        print(f"Processing DOCX from URL: {path_or_url}")
+        logger.info("Processing DOCX from URL: %s", path_or_url)
 
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(60.0),
@@ -895,7 +974,9 @@ async def load_docx_semantic(path_or_url: str, max_chunks: int = 100, query: str
             response = await client.get(path_or_url, follow_redirects=True)
             response.raise_for_status()
 
-            file_path = Path(tempfile.mkstemp(suffix=".docx")[1])
+            fd, temp_path = tempfile.mkstemp(suffix=".docx")
+            os.close(fd)
+            file_path = Path(temp_path)
             with open(file_path, "wb") as f:
                 f.write(response.content)
             temp_download = True
@@ -906,7 +987,7 @@ async def load_docx_semantic(path_or_url: str, max_chunks: int = 100, query: str
 
     # Extract and print document preview
     doc_preview = await run_in_threadpool(extract_docx_preview, str(file_path))
-    print(f"DOCX preview: {doc_preview}")
+    logger.debug("DOCX preview: %s", doc_preview)
 
     def load_and_split():
         try:
@@ -927,7 +1008,7 @@ async def load_docx_semantic(path_or_url: str, max_chunks: int = 100, query: str
             # Filter chunks
             semantic_filtered = [
                 doc for doc in split_docs
-                if len(doc.page_content.strip()) > 10 and len(doc.page_content.split()) > 2
+                if _has_min_content(doc.page_content)
             ]
 
             return semantic_filtered
@@ -936,13 +1017,11 @@ async def load_docx_semantic(path_or_url: str, max_chunks: int = 100, query: str
             error_details = traceback.format_exc()
             raise Exception(f"DOCX processing failed for {file_path}: {str(e)}") from e
 
-    split_docs = await run_in_threadpool(load_and_split)
-
-    if temp_download and file_path.exists():
-        try:
-            os.remove(file_path)
-        except:
-            pass
+    try:
+        split_docs = await run_in_threadpool(load_and_split)
+    finally:
+        if temp_download:
+            file_path.unlink(missing_ok=True)
 
     if not split_docs:
         raise Exception("No content extracted from DOCX")
@@ -957,7 +1036,7 @@ async def load_email_semantic(path_or_url: str, max_chunks: int = 100, query: st
     temp_download = False
 
     if path_or_url.startswith(("http://", "https://")):
-        print(f"Processing Email from URL: {path_or_url}")
+        logger.info("Processing Email from URL: %s", path_or_url)
 
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(60.0),
@@ -966,7 +1045,9 @@ async def load_email_semantic(path_or_url: str, max_chunks: int = 100, query: st
             response = await client.get(path_or_url, follow_redirects=True)
             response.raise_for_status()
 
-            file_path = Path(tempfile.mkstemp(suffix=".eml")[1])
+            fd, temp_path = tempfile.mkstemp(suffix=".eml")
+            os.close(fd)
+            file_path = Path(temp_path)
             with open(file_path, "wb") as f:
                 f.write(response.content)
             temp_download = True
@@ -975,11 +1056,13 @@ async def load_email_semantic(path_or_url: str, max_chunks: int = 100, query: st
         if not file_path.exists():
             raise FileNotFoundError(f"Email file not found: {file_path}")
 
-    # Extract and print email preview
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        email_content = f.read()
-    doc_preview = extract_email_preview(email_content)
-    print(f"Email preview: {doc_preview}")
+    # Extract and log email preview without blocking the event loop on the read
+    def read_preview():
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return extract_email_preview(f.read())
+
+    doc_preview = await run_in_threadpool(read_preview)
+    logger.debug("Email preview: %s", doc_preview)
 
     def load_and_split():
         try:
@@ -1000,7 +1083,7 @@ async def load_email_semantic(path_or_url: str, max_chunks: int = 100, query: st
             # Filter chunks
             semantic_filtered = [
                 doc for doc in split_docs
-                if len(doc.page_content.strip()) > 10 and len(doc.page_content.split()) > 2
+                if _has_min_content(doc.page_content)
             ]
 
             return semantic_filtered
@@ -1009,13 +1092,11 @@ async def load_email_semantic(path_or_url: str, max_chunks: int = 100, query: st
             error_details = traceback.format_exc()
             raise Exception(f"Email processing failed for {file_path}: {str(e)}") from e
 
-    split_docs = await run_in_threadpool(load_and_split)
-
-    if temp_download and file_path.exists():
-        try:
-            os.remove(file_path)
-        except:
-            pass
+    try:
+        split_docs = await run_in_threadpool(load_and_split)
+    finally:
+        if temp_download:
+            file_path.unlink(missing_ok=True)
 
     if not split_docs:
         raise Exception("No content extracted from email")
@@ -1039,11 +1120,8 @@ async def load_document_ultra_fast(path_or_url: str, query: str = None) -> List[
 def cleanup_temp_files(*file_paths):
     """Clean up temporary files"""
     for path in file_paths:
-        if path and os.path.exists(path):
-            try:
-                os.remove(path)
-            except:
-                pass
+        if path:
+            Path(path).unlink(missing_ok=True)
 
 
 # Additional utility functions
@@ -1090,12 +1168,12 @@ async def batch_load_documents(file_paths: List[str], max_chunks_per_doc: int =
 
     for file_path in file_paths:
         try:
-            print(f"Processing: {file_path}")
+            logger.info("Processing: %s", file_path)
             docs = await load_document_semantic(file_path, max_chunks_per_doc, query)
             results[file_path] = docs
-            print(f"Successfully loaded {len(docs)} chunks from {file_path}")
+            logger.info("Successfully loaded %d chunks from %s", len(docs), file_path)
         except Exception as e:
-            print(f"Failed to load {file_path}: {str(e)}")
+            logger.warning("Failed to load %s: %s", file_path, e)
             results[file_path] = []
 
     return results
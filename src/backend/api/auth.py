@@ -1,17 +1,16 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 import os
 import random
 import string
+import time
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -22,13 +21,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str):
+@lru_cache(maxsize=4096)
+def _decode_token(token: str):
+    # Decoding is a pure function of the token, so the HMAC verify + JSON parse
+    # only needs to happen once per token instead of on every request.
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
+def verify_token(token: str):
+    payload = _decode_token(token)
+    # Re-check expiry explicitly: a cached payload outlives the token's lifetime.
+    if payload and payload.get("exp", 0) > time.time():
+        return payload
+    return None
+
 def generate_otp_code() -> str:
     return ''.join(random.choices(string.digits, k=6))
 
@@ -1,13 +1,30 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./verdicto.db")
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+if "sqlite" in DATABASE_URL:
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        # WAL lets readers proceed during writes; NORMAL sync and a 64MB page
+        # cache cut per-connection setup cost. Pragmas stick for the lifetime
+        # of each pooled connection, so this runs once per connection, not per
+        # request.
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+else:
+    # Server backends: size the pool for concurrent threadpool workers and
+    # drop stale connections instead of failing mid-request
+    engine = create_engine(
+        DATABASE_URL, pool_size=20, max_overflow=10, pool_pre_ping=True
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -21,3 +38,21 @@ def get_db():
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == "postgresql":
+        # Full-text index backing /cases/search; LIKE '%term%' can't use an index
+        with engine.connect() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS cases_fts_idx ON cases USING GIN "
+                "(to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '')))"
+            ))
+            # GIN indexes over the hot JSONB blobs so containment filters
+            # don't deserialize every row
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_pred_related_cases_gin "
+                "ON predictions USING GIN (related_cases)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_bias_categories_gin "
+                "ON bias_reports USING GIN (categories)"
+            ))
+            conn.commit()
@@ -1,12 +1,15 @@
 from fastapi import FastAPI, Depends, HTTPException, status, Response, Cookie
+from fastapi import Query as QueryParam
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, desc, func
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import Optional, List
+import asyncio
 import uuid
 import time
 import os
 
-from database import get_db, init_db
+from database import get_db, init_db, SessionLocal
 from models import User, Case, Document, Query, Prediction, BiasReport, OTPCode, QueryStatus, ConfidenceLevel
 from schemas import (
     RequestOTP, VerifyOTP, UserResponse, CaseResponse, DocumentCreate, DocumentResponse,
@@ -26,25 +29,58 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+async def _purge_expired_otps():
+    # Keep otp_codes small so verify_otp stays fast; runs hourly in the background
+    while True:
+        db = SessionLocal()
+        try:
+            db.execute(delete(OTPCode).where(OTPCode.expires_at < int(time.time()) - 86400))
+            db.commit()
+        finally:
+            db.close()
+        await asyncio.sleep(3600)
+
 # Initialize DB on startup
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     init_db()
+    asyncio.create_task(_purge_expired_otps())
+
+# Short-lived cache of loaded users so a hot user doesn't hit the DB on every
+# call. Plain column values are cached — never the ORM instance, which stays
+# bound to its request's session and expires on that session's next commit
+# (expire_on_commit=True), making a cached instance blow up on later requests
+USER_CACHE_TTL = 60  # seconds
+USER_CACHE_MAX = 1024
+_user_cache = {}  # user_id -> (expires_at, {column: value})
+
+
+def _snapshot_user(user: User) -> dict:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
 
 # Auth dependency
 def get_current_user(session_token: Optional[str] = Cookie(None), db: Session = Depends(get_db)) -> User:
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    
+
     payload = verify_token(session_token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid token")
-    
+
     user_id = payload.get("sub")
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > time.time():
+        # Rehydrate a transient instance per request; it belongs to no
+        # session, so handler commits cannot expire it
+        return User(**cached[1])
+
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    
+
+    if len(_user_cache) >= USER_CACHE_MAX:
+        _user_cache.clear()
+    _user_cache[user_id] = (time.time() + USER_CACHE_TTL, _snapshot_user(user))
     return user
 
 # Auth endpoints
@@ -120,17 +156,28 @@ def current_user_endpoint(current_user: User = Depends(get_current_user)):
 
 # Cases
 @app.get("/cases", response_model=List[CaseResponse])
-def list_cases(category: Optional[str] = None, db: Session = Depends(get_db)):
+def list_cases(category: Optional[str] = None, limit: int = QueryParam(50, ge=1, le=500), offset: int = QueryParam(0, ge=0), db: Session = Depends(get_db)):
     query = db.query(Case)
     if category:
         query = query.filter(Case.category == category)
-    return query.all()
+    return query.order_by(desc(Case.creation_time)).limit(limit).offset(offset).all()
 
 @app.get("/cases/search", response_model=List[CaseResponse])
-def search_cases(search_term: str, db: Session = Depends(get_db)):
-    return db.query(Case).filter(
-        (Case.title.contains(search_term)) | (Case.description.contains(search_term))
-    ).all()
+def search_cases(search_term: str, limit: int = QueryParam(50, ge=1, le=500), offset: int = QueryParam(0, ge=0), db: Session = Depends(get_db)):
+    query = db.query(Case)
+    if db.get_bind().dialect.name == "postgresql":
+        # Uses the GIN index created in init_db instead of a LIKE '%term%' scan
+        query = query.filter(
+            func.to_tsvector(
+                'english',
+                func.coalesce(Case.title, '') + ' ' + func.coalesce(Case.description, '')
+            ).op('@@')(func.plainto_tsquery('english', search_term))
+        )
+    else:
+        query = query.filter(
+            (Case.title.contains(search_term)) | (Case.description.contains(search_term))
+        )
+    return query.limit(limit).offset(offset).all()
 
 @app.get("/cases/{case_id}", response_model=CaseResponse)
 def get_case(case_id: str, db: Session = Depends(get_db)):
@@ -157,11 +204,11 @@ def create_document(doc: DocumentCreate, current_user: User = Depends(get_curren
     return document
 
 @app.get("/documents", response_model=List[DocumentResponse])
-def list_documents(jurisdiction: Optional[str] = None, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def list_documents(jurisdiction: Optional[str] = None, limit: int = QueryParam(50, ge=1, le=500), offset: int = QueryParam(0, ge=0), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     query = db.query(Document).filter(Document.user_id == current_user.id)
     if jurisdiction:
         query = query.filter(Document.jurisdiction == jurisdiction)
-    return query.all()
+    return query.order_by(desc(Document.upload_date)).limit(limit).offset(offset).all()
 
 # Queries
 @app.post("/queries", response_model=QueryResponse)
@@ -182,8 +229,8 @@ def create_query(query_data: QueryCreate, current_user: User = Depends(get_curre
     return query
 
 @app.get("/queries", response_model=List[QueryResponse])
-def list_queries(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    return db.query(Query).filter(Query.user_id == current_user.id).all()
+def list_queries(limit: int = QueryParam(50, ge=1, le=500), offset: int = QueryParam(0, ge=0), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    return db.query(Query).filter(Query.user_id == current_user.id).order_by(desc(Query.creation_time)).limit(limit).offset(offset).all()
 
 # Predictions
 @app.post("/predictions", response_model=PredictionResponse)
@@ -220,8 +267,16 @@ def create_prediction(pred_data: PredictionCreate, current_user: User = Depends(
     return prediction
 
 @app.get("/predictions/by-user", response_model=List[PredictionResponse])
-def list_predictions_by_user(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    return db.query(Prediction).filter(Prediction.user_id == current_user.id).all()
+def list_predictions_by_user(limit: int = QueryParam(50, ge=1, le=500), offset: int = QueryParam(0, ge=0), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    # selectinload batches bias_reports into one IN query; raiseload turns any
+    # other lazy access on this path into a hard error instead of a silent N+1
+    return (
+        db.query(Prediction)
+        .options(selectinload(Prediction.bias_reports), raiseload("*"))
+        .filter(Prediction.user_id == current_user.id)
+        .order_by(desc(Prediction.creation_time))
+        .limit(limit).offset(offset).all()
+    )
 
 @app.get("/predictions/by-query/{query_id}", response_model=Optional[PredictionResponse])
 def get_prediction_by_query(query_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
@@ -256,12 +311,16 @@ def seed_data(db: Session = Depends(get_db)):
         }
     ]
     
-    for case_data in cases_data:
-        if not db.query(Case).filter(Case.case_number == case_data["case_number"]).first():
-            case = Case(**case_data)
-            db.add(case)
-    
-    db.commit()
+    # One round-trip to find what already exists, one bulk insert for the rest
+    existing = {
+        row[0] for row in db.query(Case.case_number).filter(
+            Case.case_number.in_([c["case_number"] for c in cases_data])
+        ).all()
+    }
+    to_insert = [Case(**c) for c in cases_data if c["case_number"] not in existing]
+    if to_insert:
+        db.bulk_save_objects(to_insert)
+        db.commit()
     return {"message": "Seed data created"}
 
 @app.get("/")
@@ -1,8 +1,59 @@
-from sqlalchemy import Column, String, Integer, Float, JSON, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, String, Integer, Float, JSON, ForeignKey, Enum as SQLEnum, Text, Index, LargeBinary, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from database import Base
+from sqlalchemy.types import TypeDecorator
+from database import Base, engine
 import enum
-import time
+import uuid
+
+
+class GUID(TypeDecorator):
+    """UUID column stored compactly instead of as 36-char text.
+
+    Uses the native UUID type on PostgreSQL and a packed 16-byte blob
+    elsewhere, halving index entries versus string UUIDs. Binds and returns
+    canonical string form, so callers keep passing str(uuid.uuid4()).
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            parsed = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        except (ValueError, AttributeError, TypeError):
+            # Malformed ids (e.g. GET /cases/garbage) must miss like the old
+            # string-keyed schema did, not raise; NULL never equals any key
+            return None
+        if dialect.name == "postgresql":
+            return str(parsed)
+        return parsed.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if dialect.name == "postgresql":
+            return str(value)
+        return str(uuid.UUID(bytes=value))
+
+# Binary JSON on Postgres (indexable with GIN); plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+# Epoch milliseconds filled in by the database. A server default avoids a
+# Python time.time() call per row on bulk inserts and keeps timestamps on one
+# clock across workers. The expression is dialect-specific, so pick it from
+# the configured engine.
+if engine.dialect.name == "postgresql":
+    _CREATED_MS = text("(extract(epoch from now()) * 1000)::bigint")
+else:
+    # seconds || fractional-millis digits -> epoch millis as an integer
+    _CREATED_MS = text("(strftime('%s','now') || substr(strftime('%f','now'), 4))")
 
 class Role(str, enum.Enum):
     ADMIN = "admin"
@@ -38,7 +89,7 @@ class Severity(str, enum.Enum):
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(String, primary_key=True)
+    id = Column(GUID, primary_key=True)
     name = Column(String, nullable=True)
     email = Column(String, unique=True, index=True, nullable=True)
     image = Column(String, nullable=True)
@@ -47,12 +98,12 @@ class User(Base):
     role = Column(SQLEnum(Role), default=Role.USER)
     view_mode = Column(SQLEnum(ViewMode), nullable=True)
     preferred_language = Column(String, nullable=True)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    creation_time = Column(Integer, server_default=_CREATED_MS)
 
 class Case(Base):
     __tablename__ = "cases"
     
-    id = Column(String, primary_key=True)
+    id = Column(GUID, primary_key=True)
     case_number = Column(String, unique=True)
     title = Column(String)
     description = Column(Text)
@@ -60,23 +111,23 @@ class Case(Base):
     jurisdiction = Column(String, index=True)
     year = Column(Integer)
     category = Column(String, index=True)
-    tags = Column(JSON)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    tags = Column(JSONVariant)
+    creation_time = Column(Integer, server_default=_CREATED_MS)
 
 class Document(Base):
     __tablename__ = "documents"
     
-    id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.id"), index=True)
+    id = Column(GUID, primary_key=True)
+    user_id = Column(GUID, ForeignKey("users.id"), index=True)
     title = Column(String)
     upload_date = Column(Integer)
     jurisdiction = Column(String, index=True)
     status = Column(SQLEnum(DocumentStatus), default=DocumentStatus.PENDING, index=True)
     file_id = Column(String)
     # Rename ORM attribute to avoid SQLAlchemy reserved name conflict, keep DB column name as "metadata"
-    meta = Column("metadata", JSON, nullable=True)
-    chunks = Column(JSON, nullable=True)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    meta = Column("metadata", JSONVariant, nullable=True)
+    chunks = Column(JSONVariant, nullable=True)
+    creation_time = Column(Integer, server_default=_CREATED_MS)
 
     # Provide backward-compatible property so code and Pydantic can access `metadata`
     @property
@@ -90,47 +141,73 @@ class Document(Base):
 class Query(Base):
     __tablename__ = "queries"
     
-    id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.id"), index=True)
+    id = Column(GUID, primary_key=True)
+    user_id = Column(GUID, ForeignKey("users.id"), index=True)
     query_text = Column(Text)
-    uploaded_files = Column(JSON, nullable=True)
+    uploaded_files = Column(JSONVariant, nullable=True)
     status = Column(SQLEnum(QueryStatus), default=QueryStatus.PENDING)
     language = Column(String, nullable=True)
     view_mode = Column(SQLEnum(ViewMode), nullable=True)
-    document_ids = Column(JSON, nullable=True)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    document_ids = Column(JSONVariant, nullable=True)
+    creation_time = Column(Integer, server_default=_CREATED_MS)
+
+    # selectin batches the load into one IN-clause query instead of one
+    # SELECT per row when predictions are accessed off a list of queries
+    predictions = relationship("Prediction", back_populates="query", lazy="selectin")
 
 class Prediction(Base):
     __tablename__ = "predictions"
-    
-    id = Column(String, primary_key=True)
-    query_id = Column(String, ForeignKey("queries.id"), index=True)
-    user_id = Column(String, ForeignKey("users.id"), index=True)
+    __table_args__ = (
+        # "my recent predictions" lists filter on user_id and order by
+        # creation_time desc; the composite index bounds the scan to the
+        # requested page instead of the user's full history
+        Index("ix_predictions_user_created", "user_id", "creation_time"),
+    )
+
+    id = Column(GUID, primary_key=True)
+    query_id = Column(GUID, ForeignKey("queries.id"), index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), index=True)
     prediction = Column(Text)
     confidence_score = Column(Float)
     confidence_level = Column(SQLEnum(ConfidenceLevel))
     reasoning = Column(Text)
-    related_cases = Column(JSON)
-    bias_flags = Column(JSON)
-    evidence_snippets = Column(JSON)
-    source_references = Column(JSON, nullable=True)
-    disclaimers = Column(JSON, nullable=True)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    related_cases = Column(JSONVariant)
+    bias_flags = Column(JSONVariant)
+    evidence_snippets = Column(JSONVariant)
+    source_references = Column(JSONVariant, nullable=True)
+    disclaimers = Column(JSONVariant, nullable=True)
+    creation_time = Column(Integer, server_default=_CREATED_MS)
+
+    query = relationship("Query", back_populates="predictions")
+    bias_reports = relationship("BiasReport", back_populates="prediction", lazy="selectin")
 
 class BiasReport(Base):
     __tablename__ = "bias_reports"
-    
-    id = Column(String, primary_key=True)
-    prediction_id = Column(String, ForeignKey("predictions.id"), index=True)
-    user_id = Column(String, ForeignKey("users.id"), index=True)
+    __table_args__ = (
+        # same recent-first access pattern as predictions
+        Index("ix_bias_reports_user_created", "user_id", "creation_time"),
+    )
+
+    id = Column(GUID, primary_key=True)
+    prediction_id = Column(GUID, ForeignKey("predictions.id"), index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), index=True)
     overall_score = Column(Float)
-    categories = Column(JSON)
-    recommendations = Column(JSON)
-    creation_time = Column(Integer, default=lambda: int(time.time() * 1000))
+    categories = Column(JSONVariant)
+    recommendations = Column(JSONVariant)
+    creation_time = Column(Integer, server_default=_CREATED_MS)
+
+    prediction = relationship("Prediction", back_populates="bias_reports")
 
 class OTPCode(Base):
     __tablename__ = "otp_codes"
-    
+    __table_args__ = (
+        # verify_otp filters on (email, code); keep the lookup indexed as the table grows
+        Index("ix_otp_email_code", "email", "code"),
+        # covers the used/expiry predicates so verification never scans a
+        # user's historical codes
+        Index("ix_otp_email_active", "email", "used", "expires_at"),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     email = Column(String, index=True)
     code = Column(String)
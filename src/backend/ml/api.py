@@ -13,14 +13,31 @@ This module provides REST API endpoints for:
 All features consolidated into a single API on port 8001.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing import List, Literal, Optional, Dict, Any
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import hashlib
+import os
+import orjson
+import itertools
+import time
+import json
+import logging
+import sys
 import uvicorn
 from datetime import datetime
 
+logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", stream=sys.stdout)
+log = logging.getLogger("lexai")
+log.setLevel(logging.INFO)
+
 from bias_prediction_engine import analyze_legal_case, get_model
+from cache import get_cached_translation, cache_translation
 from translation_service import get_translation_service
 from document_generator import get_document_generator
 from simulation_engine import get_simulation_engine
@@ -29,21 +46,104 @@ from simulation_engine import get_simulation_engine
 # FASTAPI APP SETUP
 # ============================================================================
 
+async def _timed_load(name: str, factory):
+    """Initialize one service on a worker thread, reporting its load time"""
+    start = time.perf_counter()
+    instance = await asyncio.to_thread(factory)
+    log.info("[OK] %s ready in %.1fs", name, time.perf_counter() - start)
+    return instance
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load every service once and prime the model before traffic arrives"""
+    log.info("LexAI Unified ML API starting")
+    # The four loads are independent, so run them concurrently: startup cost
+    # is the slowest load (the BERT checkpoint), not the sum of all four
+    model, translation_service, document_generator, simulation_engine = await asyncio.gather(
+        _timed_load("InLegalBERT Model", get_model),
+        _timed_load("Translation Service (9 languages)", get_translation_service),
+        _timed_load("Document Generator (4 templates)", get_document_generator),
+        _timed_load("Simulation Engine", get_simulation_engine),
+    )
+    # Dummy forward pass primes tokenizer caches and CUDA kernels so the
+    # first real request doesn't pay the warm-up cost
+    await asyncio.to_thread(
+        model.predict_outcome,
+        "Warmup: bail application under Section 437 CrPC.",
+        compute_embedding=True,
+    )
+    _model_info_payload.cache_clear()
+    log.info("[OK] Model warm-up forward complete")
+
+    app.state.model = model
+    app.state.translation_service = translation_service
+    app.state.document_generator = document_generator
+    app.state.simulation_engine = simulation_engine
+    _translation_batcher.start()
+    ts_task = asyncio.create_task(_refresh_ts())
+    try:
+        await _cache_demo_payload(app)
+        log.info("[OK] Demo payload precomputed")
+    except Exception:
+        # Demo precompute needs outbound network (translation); fall back to
+        # building it lazily on first hit rather than failing startup
+        app.state.demo_payload = None
+    log.info("API docs: http://localhost:8001/docs")
+    log.info("Demo endpoint: http://localhost:8001/api/v1/demo/complete")
+    yield
+    ts_task.cancel()
+    _translation_batcher.stop()
+
+
 app = FastAPI(
     title="LexAI Unified ML API",
     description="Comprehensive legal AI analysis: bias detection, translation, document generation, and simulation",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# CORS configuration
+# CORS configuration. A fixed allow-list (overridable via env) lets Starlette
+# short-circuit origin checks instead of rebuilding the allow-origin header
+# per preflight, which the wildcard + credentials combination forces.
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ALLOW_ORIGINS", "http://localhost:3000,http://localhost:5173"
+    ).split(",")
+    if origin.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_origins=sorted(ALLOWED_ORIGINS),
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# Response compression: bias reports are repetitive JSON that shrinks 5-10x.
+# Prefer Brotli (15-25% smaller than gzip on JSON); fall back to the gzip
+# middleware Starlette ships when brotli-asgi isn't installed.
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+except ImportError:
+    from starlette.middleware.gzip import GZipMiddleware
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Single 500 mapping for unexpected errors
+
+    Handlers no longer wrap their bodies in catch-all try/except blocks, so
+    expected failures raise precise HTTPExceptions at the source and anything
+    else lands here with its original traceback intact in the logs.
+    """
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
+
+
 # ============================================================================
 # PYDANTIC MODELS (Request/Response Schemas)
 # ============================================================================
@@ -51,6 +151,8 @@ app.add_middleware(
 # --- Bias Analysis Models ---
 class CaseMetadata(BaseModel):
     """Optional metadata for case analysis"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     case_type: Optional[str] = Field(None, description="Type of case (criminal, civil, bail, etc.)")
     jurisdiction: Optional[str] = Field(None, description="Court jurisdiction")
     year: Optional[int] = Field(None, description="Case year")
@@ -58,6 +160,8 @@ class CaseMetadata(BaseModel):
 
 class HistoricalCase(BaseModel):
     """Historical case data for systemic bias analysis"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     outcome: str = Field(..., description="Case outcome (conviction, acquittal, etc.)")
     gender: Optional[str] = Field(None, description="Gender of defendant")
     region: Optional[str] = Field(None, description="Geographic region")
@@ -68,6 +172,8 @@ class HistoricalCase(BaseModel):
 
 class AnalysisRequest(BaseModel):
     """Main request model for comprehensive analysis"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     case_text: str = Field(..., description="Legal document/FIR/judgment text", min_length=10)
     rag_summary: Optional[str] = Field(None, description="AI-generated summary for RAG bias detection")
     source_documents: Optional[List[str]] = Field(None, description="Source documents used for RAG")
@@ -77,23 +183,31 @@ class AnalysisRequest(BaseModel):
 
 class DocumentBiasRequest(BaseModel):
     """Request for document-only bias detection"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     case_text: str = Field(..., description="Legal document text")
     threshold: float = Field(0.15, ge=0.0, le=1.0, description="Bias detection threshold")
 
 
 class RAGBiasRequest(BaseModel):
     """Request for RAG output bias detection"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     rag_summary: str = Field(..., description="AI-generated summary")
     source_documents: List[str] = Field(..., description="Source documents")
 
 
 class SystemicBiasRequest(BaseModel):
     """Request for systemic bias analysis"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     historical_cases: List[HistoricalCase] = Field(..., description="Historical case data")
 
 
 class OutcomePredictionRequest(BaseModel):
     """Request for outcome prediction only"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     case_text: str = Field(..., description="Legal case text")
     case_metadata: Optional[CaseMetadata] = Field(None, description="Optional case metadata")
 
@@ -110,10 +224,17 @@ class AnalysisResponse(BaseModel):
 
 
 # --- Translation & Simplification Models ---
+# Mirrors MultilingualService.LANGUAGES. Literal types are validated in C by
+# pydantic, so unsupported codes fail with a 422 before the handler body runs
+# instead of an exception round trip through the translation service.
+SourceLang = Literal["auto", "en", "hi", "ta", "te", "bn", "mr", "gu", "kn", "ml"]
+TargetLang = Literal["en", "hi", "ta", "te", "bn", "mr", "gu", "kn", "ml"]
+
+
 class TranslateRequest(BaseModel):
     text: str = Field(..., description="Text to translate")
-    source_lang: str = Field("auto", description="Source language (auto-detect)")
-    target_lang: str = Field("en", description="Target language")
+    source_lang: SourceLang = Field("auto", description="Source language (auto-detect)")
+    target_lang: TargetLang = Field("en", description="Target language")
 
 
 class SimplifyRequest(BaseModel):
@@ -122,6 +243,18 @@ class SimplifyRequest(BaseModel):
 
 
 # --- Document Generation Models ---
+@lru_cache(maxsize=1)
+def _doc_dispatch() -> Dict[str, Any]:
+    """Map document_type to its generator method; bound once on first use"""
+    generator = get_document_generator()
+    return {
+        'bail_application': generator.generate_bail_application,
+        'fir_complaint': generator.generate_fir,
+        'legal_notice': generator.generate_legal_notice,
+        'petition': generator.generate_petition,
+    }
+
+
 class DocumentGenerateRequest(BaseModel):
     document_type: str = Field(..., description="Type: bail_application, fir_complaint, legal_notice, petition")
     details: Dict[str, Any] = Field(..., description="Document details")
@@ -137,6 +270,125 @@ class SensitivityRequest(BaseModel):
     case_facts: str = Field(..., description="Case facts for sensitivity analysis")
 
 
+# Second-resolution response timestamp refreshed by a background task. Response
+# timestamps are informational, so serving a cached string avoids a clock read
+# plus datetime construction on every request under high RPS.
+_ts_cache = datetime.now().isoformat(timespec="seconds")
+
+
+async def _refresh_ts() -> None:
+    global _ts_cache
+    while True:
+        _ts_cache = datetime.now().isoformat(timespec="seconds")
+        await asyncio.sleep(1)
+
+
+# Monotonic analysis-id generator: ms timestamp + process-wide counter. Unlike
+# strftime at 1s granularity, ids stay unique under concurrent requests, and
+# next() on itertools.count is a single C-level op.
+_id_counter = itertools.count()
+
+
+def _aid(prefix: str) -> str:
+    return f"{prefix}_{int(time.time() * 1000):x}_{next(_id_counter):x}"
+
+
+class BatchingTranslator:
+    """
+    Coalesce concurrent translate calls into batched upstream requests
+
+    Requests queue up for a ~10ms window (or until MAX_BATCH accumulate) and
+    are grouped by (source, target) into single translate_batch calls, so a
+    burst of N concurrent translations costs one Google Translate round trip
+    per language pair instead of N.
+    """
+
+    MAX_BATCH = 32
+    WINDOW_SECONDS = 0.01
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._consume())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def submit(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, source_lang, target_lang, future))
+        return await future
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.WINDOW_SECONDS
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: Dict[tuple, list] = {}
+            for text, source_lang, target_lang, future in batch:
+                groups.setdefault((source_lang, target_lang), []).append((text, future))
+
+            service = get_translation_service()
+            for (source_lang, target_lang), items in groups.items():
+                texts = [text for text, _ in items]
+                try:
+                    results = await asyncio.to_thread(
+                        service.translate_batch, texts, source_lang, target_lang
+                    )
+                except Exception as e:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+
+
+_translation_batcher = BatchingTranslator()
+
+# Single-flight table: concurrent requests for an identical payload ride on
+# the first one's task instead of issuing duplicate upstream calls. This
+# covers the concurrent-first-miss storm the cache can't (the result isn't
+# cached until the first call finishes).
+_inflight: Dict[tuple, "asyncio.Task"] = {}
+
+
+async def _single_flight(key: tuple, produce):
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(produce())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller disconnecting must not cancel the shared task
+    return await asyncio.shield(task)
+
+
+# Pre-compile the comprehensive-analysis schema to a specialized validator at
+# import time; falls back to regular Pydantic validation when fastjsonschema is
+# not installed or cannot compile the schema.
+try:
+    import fastjsonschema
+    _validate_analysis_request = fastjsonschema.compile(AnalysisRequest.model_json_schema())
+except Exception:
+    fastjsonschema = None
+    _validate_analysis_request = None
+
+
 # ============================================================================
 # ROOT & HEALTH CHECK
 # ============================================================================
@@ -157,7 +409,7 @@ async def root():
             "document_generation": "4 legal document types",
             "simulation": "What-if scenario analysis"
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _ts_cache
     }
 
 
@@ -166,7 +418,7 @@ async def root():
 # ============================================================================
 
 @app.post("/api/v1/analyze/comprehensive", response_model=AnalysisResponse)
-async def comprehensive_analysis(request: AnalysisRequest):
+async def comprehensive_analysis(raw_request: Request):
     """
     Perform comprehensive legal case analysis including:
     - Document bias detection
@@ -175,126 +427,202 @@ async def comprehensive_analysis(request: AnalysisRequest):
     - Outcome prediction
     """
     try:
-        # Convert Pydantic models to dicts
-        historical_cases_dict = None
-        if request.historical_cases:
-            historical_cases_dict = [case.dict() for case in request.historical_cases]
-        
-        case_metadata_dict = None
-        if request.case_metadata:
-            case_metadata_dict = request.case_metadata.dict()
-        
-        # Run analysis
-        results = analyze_legal_case(
-            case_text=request.case_text,
-            rag_summary=request.rag_summary,
-            source_documents=request.source_documents,
-            historical_cases=historical_cases_dict,
-            case_metadata=case_metadata_dict
+        data = await raw_request.json()
+    except ValueError:
+        # Parsing the body by hand bypasses FastAPI's automatic 422, so a
+        # malformed payload must not fall through to the app-level 500 handler
+        raise HTTPException(status_code=422, detail="Invalid JSON body")
+
+    if _validate_analysis_request is not None:
+        # Compiled-schema fast path: validate once, then skip Pydantic's
+        # schema-graph walk via model_construct
+        try:
+            _validate_analysis_request(data)
+        except fastjsonschema.JsonSchemaException as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        request = AnalysisRequest.model_construct(**data)
+    else:
+        try:
+            request = AnalysisRequest.model_validate(data)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors())
+
+    # Convert Pydantic models to dicts; model_construct leaves nested
+    # items as plain dicts, so handle both shapes
+    historical_cases_dict = None
+    if request.historical_cases:
+        historical_cases_dict = [
+            case if isinstance(case, dict) else case.model_dump()
+            for case in request.historical_cases
+        ]
+
+    case_metadata_dict = None
+    if request.case_metadata:
+        case_metadata_dict = (
+            request.case_metadata
+            if isinstance(request.case_metadata, dict)
+            else request.case_metadata.model_dump()
+        )
+
+    # Run analysis off the event loop; the engine holds the GIL through
+    # long BERT forwards and would otherwise stall every other request
+    results = await asyncio.to_thread(
+        analyze_legal_case,
+        case_text=request.case_text,
+        rag_summary=request.rag_summary,
+        source_documents=request.source_documents,
+        historical_cases=historical_cases_dict,
+        case_metadata=case_metadata_dict
+    )
+
+    # The payload is produced internally and already trusted; model_construct
+    # skips Pydantic's field-by-field re-validation and the direct
+    # ORJSONResponse bypasses FastAPI's response coercion pass
+    response = AnalysisResponse.model_construct(**results)
+    return ORJSONResponse(content=response.model_dump())
+
+
+
+@app.post("/api/v1/analyze/comprehensive/stream")
+async def comprehensive_analysis_stream(request: AnalysisRequest):
+    """
+    Streaming variant of comprehensive analysis
+
+    Emits each analysis section as one NDJSON line as soon as it finishes, so
+    clients see the fastest section (document bias) without waiting for the
+    slowest (systemic analysis over historical cases).
+    """
+    model = get_model()
+
+    historical_cases_dict = None
+    if request.historical_cases:
+        historical_cases_dict = [case.model_dump() for case in request.historical_cases]
+    case_metadata_dict = request.case_metadata.model_dump() if request.case_metadata else None
+
+    sections = {}
+    if request.case_text:
+        sections["document_bias"] = lambda: model.detect_document_bias(request.case_text)
+        sections["outcome_prediction"] = lambda: model.predict_outcome(
+            request.case_text, case_metadata_dict
         )
-        
-        return results
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    if request.rag_summary and request.source_documents:
+        sections["rag_bias"] = lambda: model.detect_rag_output_bias(
+            request.rag_summary, request.source_documents
+        )
+    if historical_cases_dict:
+        sections["systemic_bias"] = lambda: model.detect_systemic_bias(historical_cases_dict)
+
+    async def run_section(name, fn):
+        return name, await asyncio.to_thread(fn)
+
+    async def stream():
+        pending = [run_section(name, fn) for name, fn in sections.items()]
+        for coro in asyncio.as_completed(pending):
+            name, data = await coro
+            yield orjson.dumps({"section": name, "data": data}) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @app.post("/api/v1/analyze/document-bias")
 async def document_bias_analysis(request: DocumentBiasRequest):
     """Analyze document for textual biases (gender, caste, region, etc.)"""
-    try:
-        model = get_model()
-        results = model.detect_document_bias(request.case_text, request.threshold)
-        
-        return {
-            "status": "success",
-            "analysis_id": f"doc_bias_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "granular_bias_scores": results.get("granular_scores", {}),
-            "overall_bias": results.get("overall_bias_score", 0)
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Document bias analysis failed: {str(e)}")
+    model = get_model()
+    results = await asyncio.to_thread(
+        model.detect_document_bias, request.case_text, request.threshold
+    )
+    
+    return {
+        "status": "success",
+        "analysis_id": _aid("doc_bias"),
+        "timestamp": _ts_cache,
+        "results": results,
+        "granular_bias_scores": results.get("granular_scores", {}),
+        "overall_bias": results.get("overall_bias_score", 0)
+    }
+    
 
 
 @app.post("/api/v1/analyze/rag-bias")
 async def rag_bias_analysis(request: RAGBiasRequest):
     """Analyze RAG-generated output for tone, interpretive, and selectivity biases"""
-    try:
-        model = get_model()
-        results = model.detect_rag_output_bias(
-            request.rag_summary,
-            request.source_documents
-        )
-        
-        return {
-            "status": "success",
-            "analysis_id": f"rag_bias_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().isoformat(),
-            "results": results
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"RAG bias analysis failed: {str(e)}")
+    model = get_model()
+    results = await asyncio.to_thread(
+        model.detect_rag_output_bias,
+        request.rag_summary,
+        request.source_documents
+    )
+    
+    return {
+        "status": "success",
+        "analysis_id": _aid("rag_bias"),
+        "timestamp": _ts_cache,
+        "results": results
+    }
+    
 
 
 @app.post("/api/v1/analyze/systemic-bias")
 async def systemic_bias_analysis(request: SystemicBiasRequest):
     """Analyze historical cases for systemic and statistical biases"""
-    try:
-        model = get_model()
-        historical_cases_dict = [case.dict() for case in request.historical_cases]
-        results = model.detect_systemic_bias(historical_cases_dict)
-        
-        return {
-            "status": "success",
-            "analysis_id": f"systemic_bias_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().isoformat(),
-            "results": results
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Systemic bias analysis failed: {str(e)}")
+    model = get_model()
+    historical_cases_dict = [case.model_dump() for case in request.historical_cases]
+    results = await asyncio.to_thread(model.detect_systemic_bias, historical_cases_dict)
+    
+    return {
+        "status": "success",
+        "analysis_id": _aid("systemic_bias"),
+        "timestamp": _ts_cache,
+        "results": results
+    }
+    
 
 
 @app.post("/api/v1/predict/outcome")
 async def outcome_prediction(request: OutcomePredictionRequest):
     """Predict legal case outcome with confidence score"""
-    try:
-        model = get_model()
-        case_metadata_dict = None
-        if request.case_metadata:
-            case_metadata_dict = request.case_metadata.dict()
-        
-        results = model.predict_outcome(request.case_text, case_metadata_dict)
-        
-        return {
-            "status": "success",
-            "analysis_id": f"prediction_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().isoformat(),
-            "results": results
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Outcome prediction failed: {str(e)}")
+    model = get_model()
+    case_metadata_dict = None
+    if request.case_metadata:
+        case_metadata_dict = request.case_metadata.model_dump()
+    
+    results = await asyncio.to_thread(
+        model.predict_outcome, request.case_text, case_metadata_dict
+    )
+    
+    return {
+        "status": "success",
+        "analysis_id": _aid("prediction"),
+        "timestamp": _ts_cache,
+        "results": results
+    }
+    
+
+
+@lru_cache(maxsize=1)
+def _model_info_payload() -> tuple:
+    """Build the model-info payload once; it is constant for the process lifetime"""
+    model = get_model()
+    payload = {
+        "model_name": "InLegalBERT (law-ai/InLegalBERT)",
+        "device": str(model.device),
+        "bias_types_supported": list(model.bias_keywords.keys()),
+        "status": "loaded"
+    }
+    etag = '"%s"' % hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    return payload, etag
 
 
 @app.get("/api/v1/model/info")
-async def model_info():
+async def model_info(raw_request: Request, response: Response):
     """Get information about the loaded model"""
-    try:
-        model = get_model()
-        return {
-            "model_name": "InLegalBERT (law-ai/InLegalBERT)",
-            "device": str(model.device),
-            "bias_types_supported": list(model.bias_keywords.keys()),
-            "status": "loaded",
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Model info retrieval failed: {str(e)}")
+    payload, etag = _model_info_payload()
+    if raw_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    return payload
 
 
 # ============================================================================
@@ -308,50 +636,70 @@ async def translate_query(request: TranslateRequest):
     
     **Supports**: Hindi, Tamil, Telugu, Bengali, Marathi, Gujarati, Kannada, Malayalam
     """
-    try:
-        service = get_translation_service()
-        result = service.translate_query(
-            request.text,
-            request.source_lang,
-            request.target_lang
+    result = await get_cached_translation(
+        request.text, request.source_lang, request.target_lang
+    )
+    if result is None:
+        async def produce():
+            result = await _translation_batcher.submit(
+                request.text, request.source_lang, request.target_lang
+            )
+            if "error" not in result:
+                await cache_translation(
+                    request.text, request.source_lang, request.target_lang, result
+                )
+            return result
+
+        result = await _single_flight(
+            ("query", request.text, request.source_lang, request.target_lang), produce
         )
-        
-        return {
-            "status": "success",
-            "translation": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "status": "success",
+        "translation": result,
+        "timestamp": _ts_cache
+    }
 
 
 @app.post("/api/v1/translate/response")
 async def translate_response(request: TranslateRequest):
     """Translate AI response to user's language"""
-    try:
-        service = get_translation_service()
-        result = service.translate_response(
-            request.text,
-            request.target_lang
-        )
-        
-        return {
-            "status": "success",
-            "translation": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # "response" in the source-lang slot keeps this endpoint's cache
+    # entries apart from translate_query's en->target entries, which carry
+    # a differently shaped result dict for the same text and target
+    result = await get_cached_translation(request.text, "response", request.target_lang)
+    if result is None:
+        async def produce():
+            service = get_translation_service()
+            result = await asyncio.to_thread(
+                service.translate_response,
+                request.text,
+                request.target_lang
+            )
+            if "error" not in result:
+                await cache_translation(request.text, "response", request.target_lang, result)
+            return result
+
+        result = await _single_flight(("response", request.text, request.target_lang), produce)
+    
+    return {
+        "status": "success",
+        "translation": result,
+        "timestamp": _ts_cache
+    }
+
+
+@lru_cache(maxsize=1)
+def _languages_payload() -> Dict[str, Any]:
+    """The language list never changes at runtime; build it once"""
+    languages = get_translation_service().get_supported_languages()
+    return {"languages": languages, "total": len(languages)}
 
 
 @app.get("/api/v1/languages")
 async def get_supported_languages():
     """Get list of supported languages"""
-    service = get_translation_service()
-    return {
-        "languages": service.get_supported_languages(),
-        "total": len(service.get_supported_languages())
-    }
+    return _languages_payload()
 
 
 # ============================================================================
@@ -365,20 +713,28 @@ async def simplify_legal_text(request: SimplifyRequest):
     
     **Perfect for citizens!**
     """
-    try:
-        service = get_translation_service()
-        result = service.simplify_legal_text(
-            request.legal_text,
-            request.reading_level
+    # Same cache as translation; reading_level takes the target-lang slot
+    result = await get_cached_translation(request.legal_text, "simplify", request.reading_level)
+    if result is None:
+        async def produce():
+            service = get_translation_service()
+            result = await asyncio.to_thread(
+                service.simplify_legal_text,
+                request.legal_text,
+                request.reading_level
+            )
+            await cache_translation(request.legal_text, "simplify", request.reading_level, result)
+            return result
+
+        result = await _single_flight(
+            ("simplify", request.legal_text, request.reading_level), produce
         )
-        
-        return {
-            "status": "success",
-            "simplification": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "status": "success",
+        "simplification": result,
+        "timestamp": _ts_cache
+    }
 
 
 # ============================================================================
@@ -396,40 +752,65 @@ async def generate_document(request: DocumentGenerateRequest):
     - `legal_notice`: Legal notice
     - `petition`: Court petition
     """
-    try:
-        generator = get_document_generator()
-        
-        if request.document_type == 'bail_application':
-            result = generator.generate_bail_application(request.details)
-        elif request.document_type == 'fir_complaint':
-            result = generator.generate_fir(request.details)
-        elif request.document_type == 'legal_notice':
-            result = generator.generate_legal_notice(request.details)
-        elif request.document_type == 'petition':
-            result = generator.generate_petition(request.details)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown document type: {request.document_type}"
-            )
-        
-        return {
-            "status": "success",
-            "document": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    generate = _doc_dispatch().get(request.document_type)
+    if generate is None:
+        # Raised outside the try block so it surfaces as a 400, not a
+        # swallowed-and-rewrapped 500
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown document type: {request.document_type}"
+        )
+    
+    result = await asyncio.to_thread(generate, request.details)
+    
+    return {
+        "status": "success",
+        "document": result,
+        "timestamp": _ts_cache
+    }
+
+
+@lru_cache(maxsize=1)
+def _templates_payload() -> Dict[str, Any]:
+    """Template metadata is fixed for the process lifetime; build it once"""
+    templates = get_document_generator().get_template_list()
+    return {"templates": templates, "total": len(templates)}
+
+
+@app.post("/api/v1/generate/document/stream")
+async def generate_document_stream(request: DocumentGenerateRequest):
+    """
+    Plain-text streaming variant of document generation
+
+    Sends the generated document body in chunks without the JSON envelope, so
+    clients that only want the text (downloads, printing) avoid buffering and
+    an extra copy of a multi-KB document inside a JSON string.
+    """
+    generate = _doc_dispatch().get(request.document_type)
+    if generate is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown document type: {request.document_type}"
+        )
+
+    result = await asyncio.to_thread(generate, request.details)
+    content = result['content']
+
+    async def stream():
+        for start in range(0, len(content), 8192):
+            yield content[start:start + 8192]
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/plain",
+        headers={"X-Document-Type": request.document_type}
+    )
 
 
 @app.get("/api/v1/templates")
 async def get_templates():
     """Get list of available document templates"""
-    generator = get_document_generator()
-    return {
-        "templates": generator.get_template_list(),
-        "total": len(generator.get_template_list())
-    }
+    return _templates_payload()
 
 
 # ============================================================================
@@ -449,20 +830,18 @@ async def simulate_outcome(request: SimulationRequest):
     - `reduce_flight_risk`: Show community ties
     - `enhance_evidence`: Strengthen evidence quality
     """
-    try:
-        engine = get_simulation_engine()
-        result = engine.simulate_outcome(
-            request.base_case,
-            request.modifications
-        )
-        
-        return {
-            "status": "success",
-            "simulation": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    engine = get_simulation_engine()
+    result = await asyncio.to_thread(
+        engine.simulate_outcome,
+        request.base_case,
+        request.modifications
+    )
+    
+    return {
+        "status": "success",
+        "simulation": result,
+        "timestamp": _ts_cache
+    }
 
 
 @app.post("/api/v1/simulate/sensitivity")
@@ -472,31 +851,27 @@ async def sensitivity_analysis(request: SensitivityRequest):
     
     Shows which factors have the most influence on case outcome
     """
-    try:
-        engine = get_simulation_engine()
-        result = engine.sensitivity_analysis(request.case_facts)
-        
-        return {
-            "status": "success",
-            "sensitivity": result,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    engine = get_simulation_engine()
+    result = await asyncio.to_thread(engine.sensitivity_analysis, request.case_facts)
+    
+    return {
+        "status": "success",
+        "sensitivity": result,
+        "timestamp": _ts_cache
+    }
 
 
 # ============================================================================
 # DEMO ENDPOINT
 # ============================================================================
 
-@app.get("/api/v1/demo/complete")
-async def complete_demo():
+def _build_demo_payload() -> Dict[str, Any]:
     """
-    Complete feature demonstration
-    
-    Shows all capabilities in one response
+    Run the full feature demo once
+
+    The demo inputs are fixed, so the whole four-pipeline response is
+    deterministic per server state; callers cache the serialized result.
     """
-    
     # 1. Translation
     translation_service = get_translation_service()
     translation_demo = translation_service.translate_query(
@@ -538,7 +913,7 @@ async def complete_demo():
             "2_simplification": {
                 "feature": "Plain Language Conversion",
                 "original": "habeas corpus petition under Article 226",
-                "simplified": simplification_demo['simplified_text'][:100] + "...",
+                "simplified": f"{simplification_demo['simplified_text'][:100]}...",
                 "reading_level": "Grade 8"
             },
             "3_document_generation": {
@@ -546,7 +921,7 @@ async def complete_demo():
                 "document_type": "Bail Application",
                 "length": len(doc_demo['content']),
                 "editable": doc_demo['editable'],
-                "preview": doc_demo['content'][:300] + "..."
+                "preview": f"{doc_demo['content'][:300]}..."
             },
             "4_simulation": {
                 "feature": "What-If Simulation",
@@ -563,31 +938,34 @@ async def complete_demo():
             "Template-based Document Generation",
             "Simulation Engine"
         ],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _ts_cache
     }
 
 
-# ============================================================================
-# STARTUP EVENT
-# ============================================================================
+async def _cache_demo_payload(app: FastAPI) -> bytes:
+    payload = orjson.dumps(await asyncio.to_thread(_build_demo_payload))
+    app.state.demo_payload = payload
+    app.state.demo_cached_at = datetime.now().isoformat()  # header value stays a string
+    return payload
+
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize all services on startup"""
-    print("=" * 70)
-    print("🚀 LEXAI UNIFIED ML API")
-    print("=" * 70)
-    print("✅ InLegalBERT Model: Loading...")
-    get_model()
-    print("✅ InLegalBERT Model: Ready")
-    print("✅ Translation Service: Ready (9 languages)")
-    print("✅ Document Generator: Ready (4 templates)")
-    print("✅ Simplification: Ready")
-    print("✅ Simulation Engine: Ready")
-    print("=" * 70)
-    print("📍 API Docs: http://localhost:8001/docs")
-    print("🎯 Demo Endpoint: http://localhost:8001/api/v1/demo/complete")
-    print("=" * 70)
+@app.get("/api/v1/demo/complete")
+async def complete_demo(raw_request: Request):
+    """
+    Complete feature demonstration
+    
+    Shows all capabilities in one response. The payload is precomputed at
+    startup (four pipeline runs amortized to zero per-request cost) and served
+    as static JSON; X-Cached-At reports when it was built.
+    """
+    payload = getattr(raw_request.app.state, "demo_payload", None)
+    if payload is None:
+        payload = await _cache_demo_payload(raw_request.app)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"X-Cached-At": raw_request.app.state.demo_cached_at}
+    )
 
 
 # ============================================================================
@@ -595,10 +973,21 @@ async def startup_event():
 # ============================================================================
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "api:app",
-        host="0.0.0.0",
-        port=8001,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    if os.getenv("ENV") == "dev":
+        # Hot reload is for local development only: the reloader forks a
+        # filesystem watcher and restricts the app to a single process
+        uvicorn.run(
+            "api:app",
+            host="0.0.0.0",
+            port=8001,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "api:app",
+            host="0.0.0.0",
+            port=8001,
+            workers=min(4, os.cpu_count() or 1),
+            log_level="info"
+        )
\ No newline at end of file
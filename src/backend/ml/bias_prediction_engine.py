@@ -13,15 +13,41 @@ Model: InLegalBERT (Hugging Face pretrained for Indian legal cases)
 
 import torch
 import numpy as np
+import pandas as pd
 from transformers import AutoTokenizer, AutoModelForSequenceClassification, AutoModel
 from typing import Dict, List, Any, Optional, Union
+import os
 import re
-from collections import Counter
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import json
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import ahocorasick
+except ImportError:  # pure-Python fallback below keeps scoring functional
+    ahocorasick = None
+
+try:
+    import diskcache
+except ImportError:  # embeddings are simply recomputed after a restart
+    diskcache = None
+
+# Response field -> internal bias_scores key for the granular_scores block
+_GRANULAR_SCORE_FIELDS = (
+    ("gender_bias", "gender"),
+    ("caste_bias", "caste"),
+    ("religious_bias", "religion"),
+    ("regional_bias", "region"),
+    ("socioeconomic_bias", "socioeconomic"),
+    ("judicial_attitude_bias", "judicial_attitude_bias"),
+    ("language_bias", "language_bias"),
+)
+
 # ============================================================================
 # MODEL INITIALIZATION
 # ============================================================================
@@ -43,14 +69,68 @@ class InLegalBERTEngine:
         # Load tokenizer and base model for embeddings
         # TODO: Replace "law-ai/InLegalBERT" with your fine-tuned model path
         # Example: "your-username/inlegalbert-bias-finetuned"
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # use_fast guarantees the Rust tokenizer even if the repo ships both
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
         self.base_model = AutoModel.from_pretrained(model_name)
         
         # Set device
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.base_model.to(self.device)
         self.base_model.eval()
-        
+
+        # Sequence-length buckets for compiled single-text forwards; empty
+        # means run at the text's true length
+        self._pad_buckets: tuple = ()
+
+        # On CPU, dynamic int8 quantization of the Linear layers roughly halves
+        # inference latency and shrinks the resident model ~4x; FP32 BERT is
+        # bandwidth-bound there. GPU keeps FP32 weights untouched.
+        if self.device.type == "cpu":
+            # VERDICTO_BACKEND=bettertransformer swaps in optimum's fused
+            # nested-tensor attention kernels as an alternative to int8
+            # quantization (the two don't compose: quantize_dynamic can't see
+            # the Linears inside fused layers). Missing optimum falls back to
+            # the quantized path.
+            fused = False
+            if os.environ.get("VERDICTO_BACKEND", "pt") == "bettertransformer":
+                try:
+                    from optimum.bettertransformer import BetterTransformer
+                    self.base_model = BetterTransformer.transform(self.base_model)
+                    fused = True
+                except ImportError:
+                    pass
+            if not fused:
+                self.base_model = torch.quantization.quantize_dynamic(
+                    self.base_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+        else:
+            # BF16 on GPU halves weight/activation bandwidth and engages
+            # tensor cores; the CLS-embedding cosine comparisons downstream
+            # are insensitive to the precision loss, and both embedding
+            # helpers cast their outputs back to float32.
+            self.base_model = self.base_model.to(torch.bfloat16)
+            # TF32 matmuls on Ampere+ cut the dense-layer cost with no
+            # visible effect on CLS-embedding comparisons
+            torch.set_float32_matmul_precision("high")
+            # On GPU, let the PT2 compiler fuse attention layers and strip
+            # eager dispatch overhead. dynamic=True avoids a recompile per
+            # sequence length; VERDICTO_COMPILE=0 opts out for debugging.
+            # Not applied on CPU: compile doesn't compose with the
+            # dynamically-quantized modules above. Older torch builds
+            # without the compiler keep the eager model.
+            if os.environ.get("VERDICTO_COMPILE", "1") == "1":
+                try:
+                    self.base_model = torch.compile(
+                        self.base_model, mode="reduce-overhead", dynamic=True
+                    )
+                    # reduce-overhead records a CUDA graph per distinct
+                    # shape; padding single-text forwards up to a few fixed
+                    # lengths keeps that set small (see get_embeddings)
+                    self._pad_buckets = (64, 128, 256, 512)
+                except Exception:
+                    pass
+
+
         # Bias detection keywords (Indian legal context)
         self.bias_keywords = {
             'gender': [
@@ -79,6 +159,65 @@ class InLegalBERTEngine:
             ]
         }
         
+        # Outcome-indicator keywords used by predict_outcome
+        self.outcome_keywords = {
+            'conviction': [
+                'guilty', 'convicted', 'evidence proves', 'beyond reasonable doubt',
+                'establish', 'proven', 'corroborated', 'substantiated'
+            ],
+            'acquittal': [
+                'not guilty', 'acquitted', 'benefit of doubt', 'insufficient evidence',
+                'failed to prove', 'contradictory', 'unreliable', 'doubt'
+            ]
+        }
+
+        # Subjective-language and legal-aspect vocabularies used by
+        # detect_rag_output_bias
+        self.rag_keywords = {
+            'subjective': [
+                'clearly', 'obviously', 'undoubtedly', 'certainly', 'definitely',
+                'surely', 'apparently', 'seemingly', 'arguably', 'presumably'
+            ],
+            'procedural': ['procedure', 'process', 'filing', 'hearing', 'appeal'],
+            'substantive': ['law', 'statute', 'provision', 'section', 'act'],
+            'factual': ['fact', 'evidence', 'witness', 'testimony', 'statement']
+        }
+
+        # Content-hash embedding cache. analyze_legal_case can embed the same
+        # case_text several times per request (prediction, RAG source, the
+        # semantic cache probe), and repeated API calls resend identical
+        # documents; a hit skips the whole tokenize+forward. Vectors are kept
+        # on the CPU so the cache never grows GPU memory.
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_max = 1024
+
+        # Centroid cache for RAG source-document sets: scoring several
+        # summaries against the same retrieval set (A/B drafts, user edits)
+        # reuses the averaged source embedding instead of re-embedding the set
+        self._source_centroid_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._source_centroid_cache_max = 256
+
+        # Optional disk tier under the in-process LRU: survives worker
+        # restarts and is shared by sibling uvicorn workers, so a redeploy
+        # doesn't re-embed the whole corpus of hot FIRs. FP16 storage halves
+        # the footprint; vectors are restored to float32 on read.
+        self._emb_disk = None
+        if diskcache is not None:
+            try:
+                self._emb_disk = diskcache.Cache(
+                    os.environ.get("VERDICTO_EMB_CACHE_DIR", "/var/cache/verdicto_emb"),
+                    size_limit=2 * 1024 ** 3,
+                )
+            except Exception:  # unwritable path -> memory-only caching
+                self._emb_disk = None
+
+        # Compile each vocabulary into an Aho-Corasick automaton so a keyword
+        # scan is a single O(len(text)) pass in C instead of one substring
+        # search per keyword per category
+        self._keyword_automaton = self._build_automaton(self.bias_keywords)
+        self._outcome_automaton = self._build_automaton(self.outcome_keywords)
+        self._rag_automaton = self._build_automaton(self.rag_keywords)
+
         print(f"Model loaded successfully on {self.device}")
     
     # ========================================================================
@@ -95,60 +234,248 @@ class InLegalBERTEngine:
         Returns:
             torch.Tensor: Embedding vector
         """
-        # Tokenize
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._embedding_cache.get(key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(key)
+            return torch.from_numpy(cached).to(self.device)
+
+        if self._emb_disk is not None:
+            try:
+                stored = self._emb_disk.get(key)
+            except Exception:
+                stored = None
+            if stored is not None:
+                restored = stored.astype(np.float32)
+                self._store_embedding(key, restored)
+                return torch.from_numpy(restored).to(self.device)
+
+        # Tokenize. A single text needs no padding; the forward runs at the
+        # text's real length instead of burning FLOPs on PAD positions
         inputs = self.tokenizer(
             text,
             return_tensors="pt",
             truncation=True,
-            max_length=512,
-            padding=True
+            max_length=512
         ).to(self.device)
-        
+
+        # Under the compiled GPU path, pad up to the nearest fixed bucket so
+        # CUDA-graph capture sees a handful of shapes instead of one per
+        # distinct document length. attention_mask zeros keep the CLS output
+        # identical to the unpadded forward.
+        if self._pad_buckets:
+            length = inputs["input_ids"].shape[1]
+            bucket = next((b for b in self._pad_buckets if b >= length), None)
+            if bucket is not None and bucket != length:
+                pad = bucket - length
+                pad_id = self.tokenizer.pad_token_id or 0
+                for name, value in (("input_ids", pad_id),
+                                    ("attention_mask", 0),
+                                    ("token_type_ids", 0)):
+                    if name in inputs:
+                        inputs[name] = torch.nn.functional.pad(
+                            inputs[name], (0, pad), value=value
+                        )
+
         # Get embeddings
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.base_model(**inputs)
             # Use CLS token embedding (first token)
             embeddings = outputs.last_hidden_state[:, 0, :]
-        
+
+        # float32 keeps downstream cosine/norm math stable under BF16 weights
+        embeddings = embeddings.float()
+        vector = embeddings.detach().cpu().numpy()
+        self._store_embedding(key, vector)
+        if self._emb_disk is not None:
+            try:
+                self._emb_disk.set(key, vector.astype(np.float16))
+            except Exception:
+                pass
         return embeddings
-    
-    def compute_bias_score(self, text: str, bias_type: str) -> float:
+
+    def _store_embedding(self, key: str, vector: np.ndarray) -> None:
+        """Insert into the in-process LRU tier, evicting the coldest entry"""
+        self._embedding_cache[key] = vector
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > self._embedding_cache_max:
+            self._embedding_cache.popitem(last=False)
+
+    def _forward_cls(self, texts: List[str]) -> torch.Tensor:
+        """One padded forward over texts, returning the CLS embedding matrix"""
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=512,
+            padding="longest"
+        ).to(self.device)
+
+        with torch.inference_mode():
+            outputs = self.base_model(**inputs)
+            embeddings = outputs.last_hidden_state[:, 0, :]
+
+        return embeddings.float()
+
+    def get_embeddings_batch(self, texts: List[str]) -> torch.Tensor:
         """
-        Compute bias score for a specific bias type using keyword frequency
-        and contextual analysis
-        
+        Get BERT embeddings for several texts in batched forward passes
+
+        Running texts as batches keeps the GPU/CPU busy for few kernel
+        launches instead of N sequential forwards. Texts are sorted by token
+        length and grouped into buckets whose longest member is at most 1.25x
+        the shortest, so short documents aren't padded out to the length of
+        the longest in the request; results are returned in input order.
+
         Args:
-            text: Input text
-            bias_type: Type of bias (gender, caste, etc.)
-            
+            texts: List of input text strings
+
         Returns:
-            float: Bias score between 0 and 1
+            torch.Tensor: (len(texts), hidden_size) embedding matrix
         """
-        text_lower = text.lower()
-        keywords = self.bias_keywords.get(bias_type, [])
-        
-        # Count keyword occurrences
-        keyword_count = sum(text_lower.count(keyword) for keyword in keywords)
-        
-        # Normalize by text length (words)
-        word_count = len(text.split())
+        if len(texts) <= 1:
+            return self._forward_cls(texts)
+
+        # Cheap unpadded tokenize to learn lengths; the fast tokenizer costs
+        # microseconds against the forwards it saves in padding
+        encoded = self.tokenizer(texts, truncation=True, max_length=512)
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+
+        rows: List[Optional[torch.Tensor]] = [None] * len(texts)
+
+        def run_bucket(bucket: List[int]) -> None:
+            batch = self._forward_cls([texts[i] for i in bucket])
+            for row, idx in zip(batch, bucket):
+                rows[idx] = row
+
+        bucket: List[int] = []
+        bucket_min = 0
+        for idx in order:
+            if bucket and lengths[idx] > 1.25 * bucket_min:
+                run_bucket(bucket)
+                bucket = []
+            if not bucket:
+                bucket_min = lengths[idx]
+            bucket.append(idx)
+        if bucket:
+            run_bucket(bucket)
+
+        return torch.stack(rows)
+
+    @staticmethod
+    def _temporal_trend_frame(df: "pd.DataFrame") -> Dict:
+        """Per-year totals and conviction rates from the columnar frame"""
+        if 'year' not in df:
+            return {}
+        grouped = df.dropna(subset=['year']).groupby('year')['outcome']
+        totals = grouped.size()
+        conviction_rates = grouped.apply(lambda s: (s == 'conviction').mean())
+        return {
+            int(year): {
+                'total': int(totals[year]),
+                'conviction_rate': round(float(conviction_rates[year]), 3)
+            }
+            for year in totals.index
+        }
+
+    @staticmethod
+    def _build_automaton(keyword_map: Dict[str, List[str]]):
+        """Compile a category -> keywords map into an automaton, or None"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for category, keywords in keyword_map.items():
+            for keyword in keywords:
+                automaton.add_word(keyword.lower(), category)
+        automaton.make_automaton()
+        return automaton
+
+    def _count_keywords(self, text_lower: str, automaton=None,
+                        keyword_map: Optional[Dict[str, List[str]]] = None) -> Counter:
+        """
+        Count keyword occurrences for every category in one text scan
+
+        Args:
+            text_lower: Already-lowercased input text
+            automaton: Compiled automaton for the vocabulary (None falls back
+                to substring counting over keyword_map)
+            keyword_map: category -> keywords fallback vocabulary
+
+        Returns:
+            Counter: keyword hits per category
+        """
+        if automaton is None and keyword_map is None:
+            automaton, keyword_map = self._keyword_automaton, self.bias_keywords
+        counts = Counter()
+        if automaton is not None:
+            for _, category in automaton.iter(text_lower):
+                counts[category] += 1
+            return counts
+        for category, keywords in keyword_map.items():
+            counts[category] = sum(text_lower.count(keyword) for keyword in keywords)
+        return counts
+
+    def _score_from_count(self, keyword_count: int, word_count: int) -> float:
+        """Turn a raw keyword count into a 0-1 bias score"""
         if word_count == 0:
             return 0.0
-        
+
         # Calculate frequency-based score
         frequency_score = min(keyword_count / word_count * 10, 1.0)
-        
+
         # Get contextual score using embeddings (simplified)
         # In production, use a fine-tuned classifier
         contextual_score = frequency_score * 0.8  # Simplified
-        
+
         return round(contextual_score, 3)
+
+    def _source_centroid(self, docs: List[str]) -> torch.Tensor:
+        """
+        Centroid embedding of a source-document set, cached by content
+
+        The key hashes the sorted per-document hashes, so the same set in any
+        order hits the same entry.
+        """
+        key = hashlib.blake2b(
+            b"|".join(sorted(
+                hashlib.blake2b(doc.encode("utf-8"), digest_size=16).digest()
+                for doc in docs
+            )),
+            digest_size=16
+        ).hexdigest()
+        cached = self._source_centroid_cache.get(key)
+        if cached is not None:
+            self._source_centroid_cache.move_to_end(key)
+            return torch.from_numpy(cached).to(self.device)
+
+        centroid = self.get_embeddings_batch(docs).mean(dim=0, keepdim=True)
+        self._source_centroid_cache[key] = centroid.detach().cpu().numpy()
+        if len(self._source_centroid_cache) > self._source_centroid_cache_max:
+            self._source_centroid_cache.popitem(last=False)
+        return centroid
+
+    def compute_bias_score(self, text: str, bias_type: str) -> float:
+        """
+        Compute bias score for a specific bias type using keyword frequency
+        and contextual analysis
+        
+        Args:
+            text: Input text
+            bias_type: Type of bias (gender, caste, etc.)
+            
+        Returns:
+            float: Bias score between 0 and 1
+        """
+        counts = self._count_keywords(text.lower())
+        return self._score_from_count(counts.get(bias_type, 0), len(text.split()))
     
     # ========================================================================
     # 1. DOCUMENT/TEXT BIAS DETECTION
     # ========================================================================
     
-    def detect_document_bias(self, text: str, threshold: float = 0.15) -> Dict[str, Any]:
+    def detect_document_bias(self, text: str, threshold: float = 0.15,
+                             analysis_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Detect various biases in legal documents/FIRs/judgments
         
@@ -165,11 +492,16 @@ class InLegalBERTEngine:
         
         bias_scores = {}
         bias_flags = []
-        
+
+        # One automaton pass covers every category; scores are derived from
+        # the shared counts instead of rescanning the text per bias type
+        keyword_counts = self._count_keywords(text.lower())
+        word_count = len(text.split())
+
         # Analyze each bias type using keyword-based approach
         # In production, this should use the fine-tuned model's predictions
         for bias_type in self.bias_keywords.keys():
-            score = self.compute_bias_score(text, bias_type)
+            score = self._score_from_count(keyword_counts.get(bias_type, 0), word_count)
             bias_scores[bias_type] = score
             
             if score >= threshold:
@@ -177,11 +509,12 @@ class InLegalBERTEngine:
         
         # Add new bias categories from fine-tuned model
         # These should come from actual model inference in production
-        bias_scores['judicial_attitude_bias'] = self.compute_bias_score(text, 'age') * 0.5  # Placeholder
-        bias_scores['language_bias'] = self.compute_bias_score(text, 'region') * 0.3  # Placeholder
+        bias_scores['judicial_attitude_bias'] = self._score_from_count(keyword_counts.get('age', 0), word_count) * 0.5  # Placeholder
+        bias_scores['language_bias'] = self._score_from_count(keyword_counts.get('region', 0), word_count) * 0.3  # Placeholder
         
-        # Calculate overall bias score
-        overall_bias = round(np.mean(list(bias_scores.values())), 3)
+        # Calculate overall bias score; plain sum/len over ~8 floats beats
+        # routing through a numpy array
+        overall_bias = round(sum(bias_scores.values()) / len(bias_scores), 3)
         
         # Determine severity levels and create detailed bias info
         bias_details = []
@@ -201,15 +534,10 @@ class InLegalBERTEngine:
             "bias_details": bias_details,
             "overall_bias_score": overall_bias,
             "granular_scores": {
-                "gender_bias": bias_scores.get('gender', 0),
-                "caste_bias": bias_scores.get('caste', 0),
-                "religious_bias": bias_scores.get('religion', 0),
-                "regional_bias": bias_scores.get('region', 0),
-                "socioeconomic_bias": bias_scores.get('socioeconomic', 0),
-                "judicial_attitude_bias": bias_scores.get('judicial_attitude_bias', 0),
-                "language_bias": bias_scores.get('language_bias', 0)
+                out_key: bias_scores.get(src_key, 0)
+                for out_key, src_key in _GRANULAR_SCORE_FIELDS
             },
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": analysis_timestamp or datetime.now().isoformat()
         }
     
     # ========================================================================
@@ -218,7 +546,8 @@ class InLegalBERTEngine:
     
     def detect_rag_output_bias(self, 
                                rag_summary: str, 
-                               source_documents: List[str]) -> Dict[str, Any]:
+                               source_documents: List[str],
+                               analysis_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Detect bias in AI-generated RAG summaries/reasoning
         
@@ -232,32 +561,35 @@ class InLegalBERTEngine:
         bias_flags = []
         bias_details = []
         
-        # Get embeddings
+        # The summary embedding goes through the content-hash cache; the
+        # source set's centroid is cached by set content so repeat scoring
+        # against the same retrieval set skips the batched forward entirely
         summary_emb = self.get_embeddings(rag_summary)
-        source_embs = [self.get_embeddings(doc) for doc in source_documents[:5]]  # Limit to 5
+        source_docs = source_documents[:5]  # Limit to 5
         
         # 1. TONE BIAS - Check if summary tone differs from sources
-        if source_embs:
-            avg_source_emb = torch.mean(torch.stack(source_embs), dim=0)
-            # Cosine similarity
-            similarity = torch.nn.functional.cosine_similarity(summary_emb, avg_source_emb)
+        if source_docs:
+            avg_source_emb = self._source_centroid(source_docs)
+            # Cosine similarity; one .item() moves the scalar to the host so
+            # the threshold check and score don't each trigger a device sync
+            similarity = torch.nn.functional.cosine_similarity(
+                summary_emb, avg_source_emb
+            ).item()
             
             if similarity < 0.7:  # Low similarity indicates tone shift
                 bias_flags.append("tone_bias")
                 bias_details.append({
                     "type": "tone_bias",
                     "severity": "medium",
-                    "score": round(1 - similarity.item(), 3),
+                    "score": round(1 - similarity, 3),
                     "description": "AI summary tone differs significantly from source documents"
                 })
         
-        # 2. INTERPRETIVE BIAS - Check for subjective language
-        subjective_words = [
-            'clearly', 'obviously', 'undoubtedly', 'certainly', 'definitely',
-            'surely', 'apparently', 'seemingly', 'arguably', 'presumably'
-        ]
+        # 2. INTERPRETIVE BIAS - Check for subjective language. One automaton
+        # pass over the summary covers the subjective and aspect vocabularies
         summary_lower = rag_summary.lower()
-        subjective_count = sum(summary_lower.count(word) for word in subjective_words)
+        rag_counts = self._count_keywords(summary_lower, self._rag_automaton, self.rag_keywords)
+        subjective_count = rag_counts.get('subjective', 0)
         
         if subjective_count > 2:
             bias_flags.append("interpretive_bias")
@@ -269,14 +601,9 @@ class InLegalBERTEngine:
             })
         
         # 3. SELECTIVITY BIAS - Check if summary over-represents certain aspects
-        # Count mentions of different legal aspects
-        aspects = {
-            'procedural': ['procedure', 'process', 'filing', 'hearing', 'appeal'],
-            'substantive': ['law', 'statute', 'provision', 'section', 'act'],
-            'factual': ['fact', 'evidence', 'witness', 'testimony', 'statement']
+        aspect_counts = {
+            k: rag_counts.get(k, 0) for k in ('procedural', 'substantive', 'factual')
         }
-        
-        aspect_counts = {k: sum(summary_lower.count(w) for w in v) for k, v in aspects.items()}
         max_count = max(aspect_counts.values()) if aspect_counts.values() else 1
         
         if max_count > 5 and any(count < max_count * 0.3 for count in aspect_counts.values()):
@@ -291,7 +618,7 @@ class InLegalBERTEngine:
         return {
             "biasFlags_output": bias_flags,
             "bias_details": bias_details,
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": analysis_timestamp or datetime.now().isoformat()
         }
     
     # ========================================================================
@@ -299,7 +626,8 @@ class InLegalBERTEngine:
     # ========================================================================
     
     def detect_systemic_bias(self, 
-                            historical_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+                            historical_cases: List[Dict[str, Any]],
+                            analysis_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze systemic and statistical biases from historical case data
         
@@ -318,62 +646,36 @@ class InLegalBERTEngine:
         if not historical_cases:
             return {"error": "No historical cases provided"}
         
-        # Initialize analytics
-        outcome_by_gender = {}
-        outcome_by_region = {}
-        outcome_by_caste = {}
-        outcome_by_year = {}
-        
-        # Process cases
-        for case in historical_cases:
-            outcome = case.get('outcome', 'unknown')
-            
-            # Gender analysis
-            if 'gender' in case:
-                gender = case['gender']
-                if gender not in outcome_by_gender:
-                    outcome_by_gender[gender] = []
-                outcome_by_gender[gender].append(outcome)
-            
-            # Region analysis
-            if 'region' in case:
-                region = case['region']
-                if region not in outcome_by_region:
-                    outcome_by_region[region] = []
-                outcome_by_region[region].append(outcome)
-            
-            # Caste analysis
-            if 'caste' in case:
-                caste = case['caste']
-                if caste not in outcome_by_caste:
-                    outcome_by_caste[caste] = []
-                outcome_by_caste[caste].append(outcome)
-            
-            # Temporal analysis
-            if 'year' in case:
-                year = case['year']
-                if year not in outcome_by_year:
-                    outcome_by_year[year] = []
-                outcome_by_year[year].append(outcome)
+        # One columnar frame replaces the dicts-of-lists accumulation; each
+        # groupby sweep runs in C instead of per-case Python loops. Rows
+        # missing an attribute are excluded from that axis, as before.
+        df = pd.DataFrame(historical_cases)
+        if 'outcome' in df:
+            df['outcome'] = df['outcome'].fillna('unknown')
+        else:
+            df['outcome'] = 'unknown'
         
         # Calculate disparity metrics
-        def calculate_disparity(outcome_dict: Dict) -> Dict:
-            """Calculate outcome disparities"""
-            disparity_data = {}
-            for category, outcomes in outcome_dict.items():
-                total = len(outcomes)
-                if total > 0:
-                    conviction_rate = outcomes.count('conviction') / total
-                    disparity_data[category] = {
-                        'total_cases': total,
-                        'conviction_rate': round(conviction_rate, 3),
-                        'acquittal_rate': round(outcomes.count('acquittal') / total, 3)
-                    }
-            return disparity_data
-        
-        gender_disparity = calculate_disparity(outcome_by_gender)
-        region_disparity = calculate_disparity(outcome_by_region)
-        caste_disparity = calculate_disparity(outcome_by_caste)
+        def calculate_disparity(column: str) -> Dict:
+            """Calculate outcome disparities along one demographic axis"""
+            if column not in df:
+                return {}
+            grouped = df.dropna(subset=[column]).groupby(column)['outcome']
+            totals = grouped.size()
+            conviction_rates = grouped.apply(lambda s: (s == 'conviction').mean())
+            acquittal_rates = grouped.apply(lambda s: (s == 'acquittal').mean())
+            return {
+                category: {
+                    'total_cases': int(totals[category]),
+                    'conviction_rate': round(float(conviction_rates[category]), 3),
+                    'acquittal_rate': round(float(acquittal_rates[category]), 3)
+                }
+                for category in totals.index
+            }
+        
+        gender_disparity = calculate_disparity('gender')
+        region_disparity = calculate_disparity('region')
+        caste_disparity = calculate_disparity('caste')
         
         # Detect significant disparities
         bias_flags = []
@@ -397,10 +699,7 @@ class InLegalBERTEngine:
         dashboard_data = {
             "summary_metrics": {
                 "total_cases_analyzed": len(historical_cases),
-                "overall_conviction_rate": round(
-                    sum(1 for c in historical_cases if c.get('outcome') == 'conviction') / len(historical_cases),
-                    3
-                ),
+                "overall_conviction_rate": round(float((df['outcome'] == 'conviction').mean()), 3),
                 "bias_flags_detected": len(bias_flags)
             },
             "gender_analysis": {
@@ -425,20 +724,14 @@ class InLegalBERTEngine:
                 ]
             },
             "temporal_trends": {
-                "by_year": {
-                    year: {
-                        'total': len(outcomes),
-                        'conviction_rate': round(outcomes.count('conviction') / len(outcomes), 3)
-                    }
-                    for year, outcomes in outcome_by_year.items()
-                }
+                "by_year": self._temporal_trend_frame(df)
             }
         }
         
         return {
             "systemic_bias_flags": bias_flags,
             "biasDashboardData": dashboard_data,
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": analysis_timestamp or datetime.now().isoformat()
         }
     
     # ========================================================================
@@ -447,33 +740,29 @@ class InLegalBERTEngine:
     
     def predict_outcome(self, 
                        case_text: str,
-                       case_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                       case_metadata: Optional[Dict[str, Any]] = None,
+                       analysis_timestamp: Optional[str] = None,
+                       compute_embedding: bool = False) -> Dict[str, Any]:
         """
-        Predict legal case outcome using InLegalBERT embeddings and heuristics
+        Predict legal case outcome using keyword heuristics
         
         Args:
             case_text: Full case text (FIR, facts, arguments, etc.)
             case_metadata: Optional metadata (case_type, jurisdiction, etc.)
+            compute_embedding: Also run the BERT forward and report
+                embedding_norm; off by default since the prediction itself
+                is keyword-based and the forward dominates the latency
             
         Returns:
             Dict containing prediction, confidence, and justification
         """
-        # Get text embeddings
-        embeddings = self.get_embeddings(case_text)
-        
         # Keyword-based prediction (simplified - in production use fine-tuned classifier)
-        conviction_keywords = [
-            'guilty', 'convicted', 'evidence proves', 'beyond reasonable doubt',
-            'establish', 'proven', 'corroborated', 'substantiated'
-        ]
-        acquittal_keywords = [
-            'not guilty', 'acquitted', 'benefit of doubt', 'insufficient evidence',
-            'failed to prove', 'contradictory', 'unreliable', 'doubt'
-        ]
-        
         text_lower = case_text.lower()
-        conviction_score = sum(text_lower.count(kw) for kw in conviction_keywords)
-        acquittal_score = sum(text_lower.count(kw) for kw in acquittal_keywords)
+        outcome_counts = self._count_keywords(
+            text_lower, self._outcome_automaton, self.outcome_keywords
+        )
+        conviction_score = outcome_counts.get('conviction', 0)
+        acquittal_score = outcome_counts.get('acquittal', 0)
         
         # Calculate prediction
         total_score = conviction_score + acquittal_score
@@ -519,14 +808,17 @@ class InLegalBERTEngine:
         else:
             confidence_level = "low"
         
-        return {
+        result = {
             "predictedOutcome": predicted_outcome,
             "confidenceScore": confidence_score,
             "confidenceLevel": confidence_level,
             "justification": justification,
-            "embedding_norm": float(torch.norm(embeddings).item()),
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": analysis_timestamp or datetime.now().isoformat()
         }
+        if compute_embedding:
+            embeddings = self.get_embeddings(case_text)
+            result["embedding_norm"] = float(torch.norm(embeddings).item())
+        return result
 
 # ============================================================================
 # API INTERFACE FUNCTIONS
@@ -534,15 +826,79 @@ class InLegalBERTEngine:
 
 # Global model instance (loaded once)
 _model_instance = None
+_model_lock = threading.Lock()
 
 def get_model() -> InLegalBERTEngine:
     """Get or create model instance (singleton pattern)"""
     global _model_instance
     if _model_instance is None:
-        _model_instance = InLegalBERTEngine()
+        # Double-checked lock: concurrent first requests from the server's
+        # threadpool must not each construct (and compile) their own engine
+        with _model_lock:
+            if _model_instance is None:
+                _model_instance = InLegalBERTEngine()
     return _model_instance
 
 
+# VERDICTO_EAGER_LOAD=1 builds and warms the engine at import, so the HF
+# download, quantization and compile cost land before the server starts
+# accepting traffic. The two warmup lengths hit the smallest and largest pad
+# buckets, forcing both compiled graphs up front. The API's lifespan hook
+# warms lazily-loaded engines the same way; this flag is for entry points
+# that bypass it (scripts, alternative servers).
+if os.environ.get("VERDICTO_EAGER_LOAD") == "1":
+    _eager_model = get_model()
+    _eager_model.get_embeddings("warmup")
+    _eager_model.get_embeddings("warmup " * 512)
+    del _eager_model
+
+
+# ----------------------------------------------------------------------------
+# Analysis result cache
+# ----------------------------------------------------------------------------
+# Two tiers: an exact tier keyed on a hash of the full canonicalized request,
+# and a semantic tier that matches near-identical case texts (cosine > 0.97)
+# whose remaining arguments hash identically. Repeat queries - frontend
+# retries, the same FIR re-uploaded with trivial edits - skip the whole
+# InLegalBERT pipeline.
+
+_ANALYSIS_CACHE_MAX = 2048
+_SEMANTIC_SIM_THRESHOLD = 0.97
+
+_analysis_cache = OrderedDict()  # exact_key -> result dict
+_semantic_index = []  # (context_key, unit embedding np.ndarray, exact_key)
+
+
+def _hash_args(*args) -> str:
+    payload = json.dumps(args, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _cache_store(exact_key: str, context_key: str,
+                 embedding: Optional[np.ndarray], result: Dict[str, Any]):
+    if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+        evicted_key, _ = _analysis_cache.popitem(last=False)
+        _semantic_index[:] = [e for e in _semantic_index if e[2] != evicted_key]
+    _analysis_cache[exact_key] = result
+    if embedding is not None:
+        _semantic_index.append((context_key, embedding, exact_key))
+
+
+def _semantic_lookup(context_key: str, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+    for cached_context, cached_emb, exact_key in _semantic_index:
+        if cached_context == context_key and float(cached_emb @ embedding) > _SEMANTIC_SIM_THRESHOLD:
+            return _analysis_cache.get(exact_key)
+    return None
+
+
+def _case_text_unit_embedding(model: "InLegalBERTEngine", case_text: str) -> Optional[np.ndarray]:
+    vec = model.get_embeddings(case_text)[0].detach().cpu().numpy().astype(np.float32)
+    norm = np.linalg.norm(vec)
+    if norm == 0:
+        return None
+    return vec / norm
+
+
 def analyze_legal_case(
     case_text: str,
     rag_summary: Optional[str] = None,
@@ -552,41 +908,87 @@ def analyze_legal_case(
 ) -> Dict[str, Any]:
     """
     Main API function for comprehensive legal case analysis
-    
+
     Args:
         case_text: Legal document/FIR/judgment text
         rag_summary: AI-generated summary (for RAG bias detection)
         source_documents: Source docs used for RAG (for RAG bias detection)
         historical_cases: Historical case data (for systemic bias analysis)
         case_metadata: Case metadata for outcome prediction
-        
+
     Returns:
         JSON-serializable dict with all analysis results
     """
     model = get_model()
-    
+
+    # Exact-hash tier
+    exact_key = _hash_args(case_text, rag_summary, source_documents,
+                           historical_cases, case_metadata)
+    cached = _analysis_cache.get(exact_key)
+    if cached is not None:
+        _analysis_cache.move_to_end(exact_key)
+        return {**cached, "cache_hit": True}
+
+    # Semantic tier: same non-text arguments, near-identical case text.
+    # Computing this first also warms the engine's content-hash embedding
+    # cache, so predict_outcome (and any source document equal to case_text)
+    # reuses this forward instead of re-running BERT on identical input
+    context_key = _hash_args(rag_summary, source_documents,
+                             historical_cases, case_metadata)
+    embedding = _case_text_unit_embedding(model, case_text) if case_text else None
+    if embedding is not None:
+        semantic_hit = _semantic_lookup(context_key, embedding)
+        if semantic_hit is not None:
+            return {**semantic_hit, "cache_hit": True}
+
+    # One clock read serves the envelope and every sub-analysis; the
+    # per-method datetime.now() calls only fire when a method is invoked
+    # standalone
+    now = datetime.now()
+    ts = now.isoformat()
     results = {
         "status": "success",
-        "analysis_id": f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-        "timestamp": datetime.now().isoformat()
+        "analysis_id": f"analysis_{now.strftime('%Y%m%d_%H%M%S')}",
+        "timestamp": ts
     }
     
-    # 1. Document bias detection
-    if case_text:
-        results["document_bias"] = model.detect_document_bias(case_text)
-    
-    # 2. RAG output bias detection
-    if rag_summary and source_documents:
-        results["rag_bias"] = model.detect_rag_output_bias(rag_summary, source_documents)
-    
-    # 3. Systemic bias analysis
-    if historical_cases:
-        results["systemic_bias"] = model.detect_systemic_bias(historical_cases)
-    
-    # 4. Outcome prediction
-    if case_text:
-        results["outcome_prediction"] = model.predict_outcome(case_text, case_metadata)
-    
+    # The four analyses are independent: the BERT-bound ones release the GIL
+    # inside forwards while the pure-Python systemic scan runs, so dispatching
+    # them over a small thread pool genuinely overlaps the work
+    tasks = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # 1. Document bias detection
+        if case_text:
+            tasks["document_bias"] = executor.submit(
+                model.detect_document_bias, case_text, analysis_timestamp=ts
+            )
+        
+        # 2. RAG output bias detection
+        if rag_summary and source_documents:
+            tasks["rag_bias"] = executor.submit(
+                model.detect_rag_output_bias, rag_summary, source_documents,
+                analysis_timestamp=ts
+            )
+        
+        # 3. Systemic bias analysis
+        if historical_cases:
+            tasks["systemic_bias"] = executor.submit(
+                model.detect_systemic_bias, historical_cases,
+                analysis_timestamp=ts
+            )
+        
+        # 4. Outcome prediction
+        if case_text:
+            tasks["outcome_prediction"] = executor.submit(
+                model.predict_outcome, case_text, case_metadata,
+                analysis_timestamp=ts
+            )
+        
+        for name in ("document_bias", "rag_bias", "systemic_bias", "outcome_prediction"):
+            if name in tasks:
+                results[name] = tasks[name].result()
+
+    _cache_store(exact_key, context_key, embedding, results)
     return results
 
 
@@ -0,0 +1,73 @@
+"""
+Translation Cache for LexAI
+===========================
+
+Two-tier cache in front of the Google Translate calls: an in-process LRU that
+is always on, plus an optional Redis tier shared across workers when REDIS_URL
+is configured. Identical queries (common Hindi phrases, repeated document
+simplifications) skip the network round trip entirely on a hit, and a Redis
+outage degrades silently to the local tier.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import os
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Translations of a fixed string are stable; keep them for 14 days
+CACHE_TTL_SECONDS = 14 * 24 * 3600
+
+_LOCAL_CACHE_MAX = 4096
+_local_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+_redis = None
+if aioredis is not None and os.getenv("REDIS_URL"):
+    _redis = aioredis.from_url(os.getenv("REDIS_URL"), decode_responses=True)
+
+
+def _key(text: str, src: str, tgt: str) -> str:
+    digest = hashlib.md5(text.encode("utf-8")).hexdigest()
+    return f"translate:v1:{digest}:{src}:{tgt}"
+
+
+def _store_local(key: str, result: Dict[str, Any]) -> None:
+    _local_cache[key] = result
+    _local_cache.move_to_end(key)
+    if len(_local_cache) > _LOCAL_CACHE_MAX:
+        _local_cache.popitem(last=False)
+
+
+async def get_cached_translation(text: str, src: str, tgt: str) -> Optional[Dict[str, Any]]:
+    """Return a cached translation result, or None on a miss in both tiers"""
+    key = _key(text, src, tgt)
+    cached = _local_cache.get(key)
+    if cached is not None:
+        _local_cache.move_to_end(key)
+        return cached
+    if _redis is not None:
+        try:
+            raw = await _redis.get(key)
+        except Exception:
+            raw = None
+        if raw:
+            result = json.loads(raw)
+            _store_local(key, result)
+            return result
+    return None
+
+
+async def cache_translation(text: str, src: str, tgt: str, result: Dict[str, Any]) -> None:
+    """Store a translation result in both tiers; Redis errors are swallowed"""
+    key = _key(text, src, tgt)
+    _store_local(key, result)
+    if _redis is not None:
+        try:
+            await _redis.set(key, json.dumps(result), ex=CACHE_TTL_SECONDS)
+        except Exception:
+            pass
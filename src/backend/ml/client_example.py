@@ -7,12 +7,25 @@ for bias detection and outcome prediction.
 """
 
 import requests
-import json
+try:
+    import orjson
+
+    def _pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
 from typing import Dict, Any, List
 
 # API Configuration
 API_BASE_URL = "http://localhost:8001"  # Update with your API URL
 
+# One session for all calls: keep-alive reuses the TCP (and TLS) connection
+# instead of paying a fresh handshake per example request
+_session = requests.Session()
+
 # ============================================================================
 # API CLIENT FUNCTIONS
 # ============================================================================
@@ -50,7 +63,7 @@ def comprehensive_analysis(
     # Remove None values
     payload = {k: v for k, v in payload.items() if v is not None}
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     response.raise_for_status()
     
     return response.json()
@@ -74,7 +87,7 @@ def analyze_document_bias(case_text: str, threshold: float = 0.15) -> Dict[str,
         "threshold": threshold
     }
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     response.raise_for_status()
     
     return response.json()
@@ -98,7 +111,7 @@ def analyze_rag_bias(rag_summary: str, source_documents: List[str]) -> Dict[str,
         "source_documents": source_documents
     }
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     response.raise_for_status()
     
     return response.json()
@@ -120,7 +133,7 @@ def analyze_systemic_bias(historical_cases: List[Dict]) -> Dict[str, Any]:
         "historical_cases": historical_cases
     }
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     response.raise_for_status()
     
     return response.json()
@@ -147,7 +160,7 @@ def predict_outcome(case_text: str, case_metadata: Dict = None) -> Dict[str, Any
     # Remove None values
     payload = {k: v for k, v in payload.items() if v is not None}
     
-    response = requests.post(url, json=payload)
+    response = _session.post(url, json=payload)
     response.raise_for_status()
     
     return response.json()
@@ -156,7 +169,7 @@ def predict_outcome(case_text: str, case_metadata: Dict = None) -> Dict[str, Any
 def get_model_info() -> Dict[str, Any]:
     """Get model information"""
     url = f"{API_BASE_URL}/api/v1/model/info"
-    response = requests.get(url)
+    response = _session.get(url)
     response.raise_for_status()
     return response.json()
 
@@ -262,7 +275,7 @@ if __name__ == "__main__":
     
     try:
         result = analyze_document_bias(case_text, threshold=0.15)
-        print(json.dumps(result, indent=2))
+        print(_pretty(result))
     except requests.exceptions.RequestException as e:
         print(f"✗ Error: {e}")
     
@@ -283,7 +296,7 @@ if __name__ == "__main__":
             case_text=bail_case,
             case_metadata={"case_type": "bail_application", "jurisdiction": "Delhi"}
         )
-        print(json.dumps(result, indent=2))
+        print(_pretty(result))
     except requests.exceptions.RequestException as e:
         print(f"✗ Error: {e}")
     
@@ -294,7 +307,7 @@ if __name__ == "__main__":
     
     try:
         info = get_model_info()
-        print(json.dumps(info, indent=2))
+        print(_pretty(info))
     except requests.exceptions.RequestException as e:
         print(f"✗ Error: {e}")
     
@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures for the ML API tests
+===========================================
+
+Provides a single session-scoped TestClient so FastAPI startup and the
+InLegalBERT load happen once per run, plus a response cache so tests that
+POST identical payloads (several reuse SAMPLE_CASE_TEXT verbatim) reuse the
+first response instead of re-running inference.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+import pytest
+
+# Add this directory to path so `api` and the engine modules import directly
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+
+def _install_response_cache(client: TestClient) -> None:
+    """Memoize plain-JSON POSTs on (url, payload hash) for this client"""
+    cache = {}
+    original_post = client.post
+
+    def cached_post(url, *args, **kwargs):
+        # Only cache the simple `client.post(url, json=...)` form; requests
+        # with raw bodies, custom headers etc. go straight through
+        if args or set(kwargs) != {"json"}:
+            return original_post(url, *args, **kwargs)
+        payload = json.dumps(kwargs["json"], sort_keys=True, default=str)
+        key = (url, hashlib.md5(payload.encode("utf-8")).hexdigest())
+        response = cache.get(key)
+        if response is None:
+            response = original_post(url, *args, **kwargs)
+            cache[key] = response
+        return response
+
+    client.post = cached_post
+
+
+@pytest.fixture(scope="session")
+def client():
+    from api import app
+
+    with TestClient(app) as test_client:
+        _install_response_cache(test_client)
+        yield test_client
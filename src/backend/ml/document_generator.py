@@ -6,9 +6,90 @@ Quick MVP for hackathon demo
 Generates bail applications, FIR drafts, and legal notices
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
+import string
+
+class _LegalDefaults(dict):
+    """Field mapping for _render that fills absent fields with placeholders
+
+    Seeded with a template's non-generic defaults, updated with the caller's
+    details; anything still missing renders as "[FIELD NAME]". Replaces the
+    per-field details.get(key, default) ladders, so each field costs one
+    lookup instead of two plus a branch.
+    """
+
+    def __missing__(self, key: str) -> str:
+        return '[' + key.upper().replace('_', ' ') + ']'
+
+
+# Defaults that differ from the generic "[FIELD NAME]" placeholder
+_BAIL_DEFAULTS = {
+    'court_name': 'SESSIONS JUDGE',
+    'section': '439 Cr.P.C.',
+    'fir_number': '[FIR NO.]',
+    'fir_date': '[DATE]',
+    'charges': '[IPC SECTIONS]',
+    'occupation': 'engaged in lawful occupation',
+    'family_status': 'having family responsibilities',
+}
+
+_FIR_DEFAULTS = {
+    'complainant_name': '[NAME]',
+    'father_husband_name': '[FATHER/HUSBAND NAME]',
+    'incident_date': '[DATE]',
+    'incident_time': '[TIME]',
+    'incident_place': '[PLACE]',
+    'incident_description': '[DESCRIPTION OF INCIDENT]',
+    'loss_details': 'N/A',
+    'witnesses': 'None',
+    'evidence': 'As per investigation',
+    'sections_applicable': '[IPC SECTIONS]',
+}
+
+_NOTICE_DEFAULTS = {
+    'act_section': 'RELEVANT PROVISIONS',
+    'case_facts': '[FACTS OF THE CASE]',
+    'legal_grounds': '[LEGAL VIOLATIONS]',
+    'relief_demanded': '[RELIEF SOUGHT]',
+    'advocate_contact': '[CONTACT]',
+}
+
+# Conditional bail-ground clauses: (detail key, default, clause text).
+# Frozen at module level so _generate_bail_grounds is one filtered pass
+# over static data instead of seven branches appending literals.
+_GROUND_CLAUSES = (
+    ('first_time_offender', True,
+     "a) The applicant is a first-time offender with no criminal antecedents."),
+    ('cooperating', True,
+     "b) The applicant has been fully cooperating with the investigation."),
+    ('weak_evidence', False,
+     "c) The evidence against the applicant is weak and based on circumstantial factors."),
+    ('no_flight_risk', True,
+     "d) The applicant has deep roots in the community and there is no risk of absconding."),
+    ('medical_grounds', False,
+     "e) The applicant requires medical attention which cannot be adequately provided in custody."),
+)
+
+_ALWAYS_GROUNDS = (
+    "f) The applicant's continued detention is not necessary for the purpose of investigation.",
+    "g) The applicant is willing to abide by any conditions imposed by this Hon'ble Court.",
+)
+
+_PETITION_DEFAULTS = {
+    'court_name': 'HIGH COURT OF [STATE]',
+    'petition_type': 'WRIT',
+    'petitioner_name': '[PETITIONER]',
+    'petitioner_address': '[ADDRESS]',
+    'respondent_name': '[RESPONDENT]',
+    'respondent_address': '[ADDRESS]',
+    'under_section': 'ARTICLE 226 OF THE CONSTITUTION',
+    'judge_title': 'CHIEF JUSTICE AND HIS COMPANION JUDGES',
+    'parties_description': '[PARTY DETAILS]',
+}
+
 
 class LegalDocumentGenerator:
     """
@@ -16,9 +97,32 @@ class LegalDocumentGenerator:
     """
     
     def __init__(self):
-        self.templates = self._load_templates()
+        # Templates are immutable data; all instances share the module-level
+        # copies built once at import instead of re-materializing kilobytes
+        # of strings per construction
+        self.templates = _TEMPLATES
+        self._compiled = _COMPILED_TEMPLATES
+        # Constant-time document_type dispatch for the API layers; new
+        # templates register here instead of growing endpoint elif chains
+        self._dispatch = {
+            'bail_application': self.generate_bail_application,
+            'fir_complaint': self.generate_fir,
+            'legal_notice': self.generate_legal_notice,
+            'petition': self.generate_petition,
+        }
+
+    def _render(self, name: str, values: Dict[str, Any]) -> str:
+        """Render a pre-parsed template against a field-value mapping"""
+        parts = []
+        for literal, field, _spec, _conv in self._compiled[name]:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return ''.join(parts)
     
-    def _load_templates(self) -> Dict[str, str]:
+    @staticmethod
+    def _load_templates() -> Dict[str, str]:
         """Load document templates"""
         return {
             'bail_application': """
@@ -235,206 +339,149 @@ Date: {date}
 """
         }
     
-    def generate_bail_application(self, details: Dict[str, Any]) -> Dict[str, str]:
+    def generate_bail_application(self, details: Dict[str, Any],
+                                  now: Optional[datetime] = None) -> Dict[str, str]:
         """
         Generate bail application
         
         Args:
             details: Dict containing applicant details, charges, grounds, etc.
+            now: Request timestamp; defaults to the current time. One clock
+                read covers the date default and generated_at.
         """
-        template = self.templates['bail_application']
+        now = now or datetime.now()
         
-        # Set defaults
-        doc_details = {
-            'court_name': details.get('court_name', 'SESSIONS JUDGE'),
-            'applicant_name': details.get('applicant_name', '[APPLICANT NAME]'),
-            'advocate_name': details.get('advocate_name', '[ADVOCATE NAME]'),
-            'state': details.get('state', '[STATE]'),
-            'section': details.get('section', '439 Cr.P.C.'),
-            'fir_number': details.get('fir_number', '[FIR NO.]'),
-            'fir_date': details.get('fir_date', '[DATE]'),
-            'police_station': details.get('police_station', '[POLICE STATION]'),
-            'charges': details.get('charges', '[IPC SECTIONS]'),
-            'arrest_date': details.get('arrest_date', '[ARREST DATE]'),
-            'age': details.get('age', '[AGE]'),
-            'address': details.get('address', '[ADDRESS]'),
-            'occupation': details.get('occupation', 'engaged in lawful occupation'),
-            'family_status': details.get('family_status', 'having family responsibilities'),
-            'grounds': self._generate_bail_grounds(details),
-            'place': details.get('place', '[PLACE]'),
-            'date': details.get('date', datetime.now().strftime('%d.%m.%Y')),
-        }
+        values = _LegalDefaults(_BAIL_DEFAULTS)
+        values.update(details)
+        values['grounds'] = self._generate_bail_grounds(details)
+        values.setdefault('date', now.strftime('%d.%m.%Y'))
         
-        document = template.format(**doc_details)
+        document = self._render('bail_application', values)
         
         return {
             'document_type': 'bail_application',
             'content': document,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'editable': True,
             'format': 'text/plain'
         }
     
     def _generate_bail_grounds(self, details: Dict[str, Any]) -> str:
         """Auto-generate bail grounds based on details"""
-        grounds = []
-        
-        if details.get('first_time_offender', True):
-            grounds.append("a) The applicant is a first-time offender with no criminal antecedents.")
-        
-        if details.get('cooperating', True):
-            grounds.append("b) The applicant has been fully cooperating with the investigation.")
-        
-        if details.get('weak_evidence', False):
-            grounds.append("c) The evidence against the applicant is weak and based on circumstantial factors.")
-        
-        if details.get('no_flight_risk', True):
-            grounds.append("d) The applicant has deep roots in the community and there is no risk of absconding.")
-        
-        if details.get('medical_grounds', False):
-            grounds.append("e) The applicant requires medical attention which cannot be adequately provided in custody.")
-        
-        grounds.append("f) The applicant's continued detention is not necessary for the purpose of investigation.")
-        grounds.append("g) The applicant is willing to abide by any conditions imposed by this Hon'ble Court.")
-        
+        grounds = [
+            clause for key, default, clause in _GROUND_CLAUSES
+            if details.get(key, default)
+        ]
+        grounds.extend(_ALWAYS_GROUNDS)
         return '\n   '.join(grounds)
     
-    def generate_fir(self, details: Dict[str, Any]) -> Dict[str, str]:
+    def generate_fir(self, details: Dict[str, Any],
+                     now: Optional[datetime] = None) -> Dict[str, str]:
         """Generate FIR/Complaint"""
-        template = self.templates['fir_complaint']
+        now = now or datetime.now()
         
-        doc_details = {
-            'police_station': details.get('police_station', '[POLICE STATION]'),
-            'district': details.get('district', '[DISTRICT]'),
-            'date': details.get('date', datetime.now().strftime('%d.%m.%Y')),
-            'time': details.get('time', datetime.now().strftime('%H:%M')),
-            'complainant_name': details.get('complainant_name', '[NAME]'),
-            'father_husband_name': details.get('father_husband_name', '[FATHER/HUSBAND NAME]'),
-            'address': details.get('address', '[ADDRESS]'),
-            'phone': details.get('phone', '[PHONE]'),
-            'email': details.get('email', '[EMAIL]'),
-            'accused_details': details.get('accused_details', '[ACCUSED DETAILS]'),
-            'incident_date': details.get('incident_date', '[DATE]'),
-            'incident_time': details.get('incident_time', '[TIME]'),
-            'incident_place': details.get('incident_place', '[PLACE]'),
-            'incident_description': details.get('incident_description', '[DESCRIPTION OF INCIDENT]'),
-            'loss_details': details.get('loss_details', 'N/A'),
-            'witnesses': details.get('witnesses', 'None'),
-            'evidence': details.get('evidence', 'As per investigation'),
-            'sections_applicable': details.get('sections_applicable', '[IPC SECTIONS]'),
-        }
+        values = _LegalDefaults(_FIR_DEFAULTS)
+        values.update(details)
+        values.setdefault('date', now.strftime('%d.%m.%Y'))
+        values.setdefault('time', now.strftime('%H:%M'))
         
-        document = template.format(**doc_details)
+        document = self._render('fir_complaint', values)
         
         return {
             'document_type': 'fir_complaint',
             'content': document,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'editable': True,
             'format': 'text/plain'
         }
     
-    def generate_legal_notice(self, details: Dict[str, Any]) -> Dict[str, str]:
+    def generate_legal_notice(self, details: Dict[str, Any],
+                     now: Optional[datetime] = None) -> Dict[str, str]:
         """Generate legal notice"""
-        template = self.templates['legal_notice']
+        now = now or datetime.now()
         
-        doc_details = {
-            'date': details.get('date', datetime.now().strftime('%d.%m.%Y')),
-            'recipient_name': details.get('recipient_name', '[RECIPIENT NAME]'),
-            'recipient_address': details.get('recipient_address', '[RECIPIENT ADDRESS]'),
-            'act_section': details.get('act_section', 'RELEVANT PROVISIONS'),
-            'client_name': details.get('client_name', '[CLIENT NAME]'),
-            'client_address': details.get('client_address', '[CLIENT ADDRESS]'),
-            'case_facts': details.get('case_facts', '[FACTS OF THE CASE]'),
-            'cause_of_action': details.get('cause_of_action', '[CAUSE OF ACTION]'),
-            'legal_grounds': details.get('legal_grounds', '[LEGAL VIOLATIONS]'),
-            'relief_demanded': details.get('relief_demanded', '[RELIEF SOUGHT]'),
-            'advocate_name': details.get('advocate_name', '[ADVOCATE NAME]'),
-            'advocate_address': details.get('advocate_address', '[ADVOCATE ADDRESS]'),
-            'advocate_contact': details.get('advocate_contact', '[CONTACT]'),
-        }
+        values = _LegalDefaults(_NOTICE_DEFAULTS)
+        values.update(details)
+        values.setdefault('date', now.strftime('%d.%m.%Y'))
         
-        document = template.format(**doc_details)
+        document = self._render('legal_notice', values)
         
         return {
             'document_type': 'legal_notice',
             'content': document,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'editable': True,
             'format': 'text/plain'
         }
     
-    def generate_petition(self, details: Dict[str, Any]) -> Dict[str, str]:
+    def generate_petition(self, details: Dict[str, Any],
+                     now: Optional[datetime] = None) -> Dict[str, str]:
         """Generate petition"""
-        template = self.templates['petition']
+        now = now or datetime.now()
         
-        doc_details = {
-            'court_name': details.get('court_name', 'HIGH COURT OF [STATE]'),
-            'petition_type': details.get('petition_type', 'WRIT'),
-            'petitioner_name': details.get('petitioner_name', '[PETITIONER]'),
-            'petitioner_address': details.get('petitioner_address', '[ADDRESS]'),
-            'respondent_name': details.get('respondent_name', '[RESPONDENT]'),
-            'respondent_address': details.get('respondent_address', '[ADDRESS]'),
-            'under_section': details.get('under_section', 'ARTICLE 226 OF THE CONSTITUTION'),
-            'judge_title': details.get('judge_title', 'CHIEF JUSTICE AND HIS COMPANION JUDGES'),
-            'parties_description': details.get('parties_description', '[PARTY DETAILS]'),
-            'facts': details.get('facts', '[FACTS]'),
-            'cause_of_action': details.get('cause_of_action', '[CAUSE OF ACTION]'),
-            'grounds': details.get('grounds', '[GROUNDS]'),
-            'relief_prayed': details.get('relief_prayed', '[RELIEF PRAYED]'),
-            'place': details.get('place', '[PLACE]'),
-            'date': details.get('date', datetime.now().strftime('%d.%m.%Y')),
-        }
+        values = _LegalDefaults(_PETITION_DEFAULTS)
+        values.update(details)
+        values.setdefault('date', now.strftime('%d.%m.%Y'))
         
-        document = template.format(**doc_details)
+        document = self._render('petition', values)
         
         return {
             'document_type': 'petition',
             'content': document,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'editable': True,
             'format': 'text/plain'
         }
     
     def get_template_list(self) -> list:
         """Get list of available templates"""
-        return [
-            {
-                'id': 'bail_application',
-                'name': 'Bail Application',
-                'description': 'Application for bail under CrPC Section 439',
-                'category': 'Criminal'
-            },
-            {
-                'id': 'fir_complaint',
-                'name': 'FIR / Complaint',
-                'description': 'First Information Report for filing with police',
-                'category': 'Criminal'
-            },
-            {
-                'id': 'legal_notice',
-                'name': 'Legal Notice',
-                'description': 'Legal notice under relevant provisions',
-                'category': 'General'
-            },
-            {
-                'id': 'petition',
-                'name': 'Petition',
-                'description': 'Writ petition or other court petition',
-                'category': 'Civil/Writ'
-            }
-        ]
-
-
-# Global instance
-_doc_generator = None
-
+        # Static catalogue data; only the outer list is allocated per call
+        return list(_TEMPLATE_LIST)
+
+
+_TEMPLATE_LIST = (
+    {
+        'id': 'bail_application',
+        'name': 'Bail Application',
+        'description': 'Application for bail under CrPC Section 439',
+        'category': 'Criminal'
+    },
+    {
+        'id': 'fir_complaint',
+        'name': 'FIR / Complaint',
+        'description': 'First Information Report for filing with police',
+        'category': 'Criminal'
+    },
+    {
+        'id': 'legal_notice',
+        'name': 'Legal Notice',
+        'description': 'Legal notice under relevant provisions',
+        'category': 'General'
+    },
+    {
+        'id': 'petition',
+        'name': 'Petition',
+        'description': 'Writ petition or other court petition',
+        'category': 'Civil/Writ'
+    },
+)
+
+# Raw and pre-parsed templates, one copy per process regardless of how many
+# generator instances tests or workers construct. str.format re-tokenizes
+# its format string per call; the parsed chunk lists render with lookups and
+# one join (see _render). The templates use bare {field} placeholders, so
+# specs/conversions from the parse are ignored.
+_TEMPLATES: Dict[str, str] = LegalDocumentGenerator._load_templates()
+_COMPILED_TEMPLATES = {
+    name: tuple(string.Formatter().parse(template))
+    for name, template in _TEMPLATES.items()
+}
+
+
+@lru_cache(maxsize=1)
 def get_document_generator() -> LegalDocumentGenerator:
-    """Get or create document generator instance"""
-    global _doc_generator
-    if _doc_generator is None:
-        _doc_generator = LegalDocumentGenerator()
-    return _doc_generator
+    """Get or create document generator instance (process-wide singleton)"""
+    return LegalDocumentGenerator()
 
 
 # Test
@@ -9,16 +9,69 @@ Additional endpoints for impressive hackathon features:
 - What-if simulation
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
+import asyncio
+import copy
+import hashlib
+import os
+import orjson
 import uvicorn
 from datetime import datetime
 
 from translation_service import get_translation_service
 from document_generator import get_document_generator
 from simulation_engine import get_simulation_engine
+from cache import get_cached_translation, cache_translation
+
+# Bind the singletons at import: handlers skip the per-request
+# call-through-lru_cache dance, and the heavyweight pieces (the simulation
+# engine pulls in InLegalBERT) initialize before the first request instead
+# of adding seconds to it
+_TRANSLATION = get_translation_service()
+_GENERATOR = get_document_generator()
+_SIMULATION = get_simulation_engine()
+
+
+# The root, languages and templates payloads never change at runtime, so
+# encode each once and serve the bytes; the ETag lets repeat clients get a
+# bodyless 304 instead of re-downloading
+def _static_json(payload: Dict[str, Any]) -> tuple:
+    body = orjson.dumps(payload)
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+_LANGUAGES = _TRANSLATION.get_supported_languages()
+_TEMPLATES = _GENERATOR.get_template_list()
+_ROOT_BYTES, _ROOT_ETAG = _static_json({
+    "service": "LexAI Hackathon Demo API",
+    "status": "ready to impress judges! 🚀",
+    "features": [
+        "Multilingual Translation (9 languages)",
+        "Legal Document Generator (4 types)",
+        "Plain Language Simplification",
+        "What-If Simulation Engine",
+        "Sensitivity Analysis"
+    ],
+    "version": "2.0.0"
+})
+_LANGS_BYTES, _LANGS_ETAG = _static_json({
+    "languages": _LANGUAGES,
+    "total": len(_LANGUAGES)
+})
+_TEMPLATES_BYTES, _TEMPLATES_ETAG = _static_json({
+    "templates": _TEMPLATES,
+    "total": len(_TEMPLATES)
+})
 
 # ============================================================================
 # FASTAPI APP
@@ -27,59 +80,99 @@ from simulation_engine import get_simulation_engine
 app = FastAPI(
     title="LexAI Hackathon Demo API",
     description="Impressive features for hackathon judges",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serializes the multi-KB rendered documents and Devanagari/Tamil
+    # translation payloads in C, without stdlib json's ensure_ascii scan
+    default_response_class=ORJSONResponse
 )
 
+# Same fixed allow-list as the main ML API: wildcard + credentials pushes
+# Starlette onto its per-request origin-echo path, and an explicit list lets
+# browsers cache preflights for a day instead of re-asking before every POST
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ALLOW_ORIGINS", "http://localhost:3000,http://localhost:5173"
+    ).split(",")
+    if origin.strip()
+)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=sorted(ALLOWED_ORIGINS),
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# Rendered legal boilerplate compresses >5x; prefer Brotli, fall back to the
+# gzip middleware Starlette ships when brotli-asgi isn't installed
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+except ImportError:
+    from fastapi.middleware.gzip import GZipMiddleware
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # ============================================================================
 # PYDANTIC MODELS
 # ============================================================================
 
+# extra="ignore" keeps pydantic-core on its Rust fast path (no extra-key
+# scan), and frozen models skip post-validation mutation hooks; the demo
+# endpoints read fields once and never mutate the request
 class TranslateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(..., description="Text to translate")
     source_lang: str = Field("auto", description="Source language (auto-detect)")
     target_lang: str = Field("en", description="Target language")
 
 class SimplifyRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     legal_text: str = Field(..., description="Complex legal text")
     reading_level: str = Field("simple", description="Reading level (simple/intermediate)")
 
 class DocumentGenerateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     document_type: str = Field(..., description="Type: bail_application, fir_complaint, legal_notice, petition")
     details: Dict[str, Any] = Field(..., description="Document details")
 
 class SimulationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     base_case: Dict[str, Any] = Field(..., description="Original case facts")
     modifications: Dict[str, Any] = Field(..., description="Modifications to test")
 
 class SensitivityRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     case_facts: str = Field(..., description="Case facts for sensitivity analysis")
 
+# Single-flight table: concurrent requests for an identical payload ride on
+# the first one's task instead of issuing duplicate upstream calls — the
+# cache can't absorb a burst that arrives before the first result lands
+_inflight: Dict[tuple, "asyncio.Task"] = {}
+
+
+async def _single_flight(key: tuple, produce):
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(produce())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller disconnecting must not cancel the shared task
+    return await asyncio.shield(task)
+
+
 # ============================================================================
 # TRANSLATION ENDPOINTS
 # ============================================================================
 
 @app.get("/")
-async def root():
-    return {
-        "service": "LexAI Hackathon Demo API",
-        "status": "ready to impress judges! 🚀",
-        "features": [
-            "Multilingual Translation (9 languages)",
-            "Legal Document Generator (4 types)",
-            "Plain Language Simplification",
-            "What-If Simulation Engine",
-            "Sensitivity Analysis"
-        ],
-        "version": "2.0.0"
-    }
+async def root(request: Request):
+    return _static_response(request, _ROOT_BYTES, _ROOT_ETAG)
 
 @app.post("/api/v1/translate/query")
 async def translate_query(request: TranslateRequest):
@@ -89,12 +182,30 @@ async def translate_query(request: TranslateRequest):
     **Supports**: Hindi, Tamil, Telugu, Bengali, Marathi, Gujarati, Kannada, Malayalam
     """
     try:
-        service = get_translation_service()
-        result = service.translate_query(
-            request.text,
-            request.source_lang,
-            request.target_lang
+        # Same two-tier content-hash cache as the main ML API; repeats of
+        # common phrases skip the network round trip entirely
+        result = await get_cached_translation(
+            request.text, request.source_lang, request.target_lang
         )
+        if result is None:
+            async def produce():
+                # Off the event loop: the translate call blocks on network I/O
+                result = await asyncio.to_thread(
+                    _TRANSLATION.translate_query,
+                    request.text,
+                    request.source_lang,
+                    request.target_lang
+                )
+                if "error" not in result:
+                    await cache_translation(
+                        request.text, request.source_lang, request.target_lang, result
+                    )
+                return result
+
+            result = await _single_flight(
+                ("query", request.text, request.source_lang, request.target_lang),
+                produce
+            )
         
         return {
             "status": "success",
@@ -110,11 +221,25 @@ async def translate_response(request: TranslateRequest):
     Translate AI response to user's language
     """
     try:
-        service = get_translation_service()
-        result = service.translate_response(
-            request.text,
-            request.target_lang
+        result = await get_cached_translation(
+            request.text, "response", request.target_lang
         )
+        if result is None:
+            async def produce():
+                result = await asyncio.to_thread(
+                    _TRANSLATION.translate_response,
+                    request.text,
+                    request.target_lang
+                )
+                if "error" not in result:
+                    await cache_translation(
+                        request.text, "response", request.target_lang, result
+                    )
+                return result
+
+            result = await _single_flight(
+                ("response", request.text, request.target_lang), produce
+            )
         
         return {
             "status": "success",
@@ -125,13 +250,9 @@ async def translate_response(request: TranslateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/languages")
-async def get_supported_languages():
+async def get_supported_languages(request: Request):
     """Get list of supported languages"""
-    service = get_translation_service()
-    return {
-        "languages": service.get_supported_languages(),
-        "total": len(service.get_supported_languages())
-    }
+    return _static_response(request, _LANGS_BYTES, _LANGS_ETAG)
 
 # ============================================================================
 # SIMPLIFICATION ENDPOINTS
@@ -145,11 +266,25 @@ async def simplify_legal_text(request: SimplifyRequest):
     **Perfect for citizens!**
     """
     try:
-        service = get_translation_service()
-        result = service.simplify_legal_text(
-            request.legal_text,
-            request.reading_level
+        # Same cache as translation; reading_level takes the target-lang slot
+        result = await get_cached_translation(
+            request.legal_text, "simplify", request.reading_level
         )
+        if result is None:
+            async def produce():
+                result = await asyncio.to_thread(
+                    _TRANSLATION.simplify_legal_text,
+                    request.legal_text,
+                    request.reading_level
+                )
+                await cache_translation(
+                    request.legal_text, "simplify", request.reading_level, result
+                )
+                return result
+
+            result = await _single_flight(
+                ("simplify", request.legal_text, request.reading_level), produce
+            )
         
         return {
             "status": "success",
@@ -164,7 +299,7 @@ async def simplify_legal_text(request: SimplifyRequest):
 # ============================================================================
 
 @app.post("/api/v1/generate/document")
-async def generate_document(request: DocumentGenerateRequest):
+async def generate_document(request: DocumentGenerateRequest, format: str = "json"):
     """
     Generate legal documents from templates
     
@@ -173,40 +308,44 @@ async def generate_document(request: DocumentGenerateRequest):
     - `fir_complaint`: FIR/Complaint for police
     - `legal_notice`: Legal notice
     - `petition`: Court petition
+    
+    Pass `?format=text` to stream the raw document body without the JSON
+    envelope — multi-KB petitions then skip the JSON-escape pass entirely.
     """
+    generate = _GENERATOR._dispatch.get(request.document_type)
+    if generate is None:
+        # Raised outside the try block so it surfaces as a 400, not a
+        # swallowed-and-rewrapped 500
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown document type: {request.document_type}"
+        )
+    
     try:
-        generator = get_document_generator()
+        now = datetime.now()  # one clock read stamps document and envelope
+        result = await asyncio.to_thread(generate, request.details, now)
         
-        if request.document_type == 'bail_application':
-            result = generator.generate_bail_application(request.details)
-        elif request.document_type == 'fir_complaint':
-            result = generator.generate_fir(request.details)
-        elif request.document_type == 'legal_notice':
-            result = generator.generate_legal_notice(request.details)
-        elif request.document_type == 'petition':
-            result = generator.generate_petition(request.details)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown document type: {request.document_type}"
-            )
+        if format == "text":
+            content = result['content']
+
+            async def stream():
+                for start in range(0, len(content), 8192):
+                    yield content[start:start + 8192]
+
+            return StreamingResponse(stream(), media_type="text/plain")
         
         return {
             "status": "success",
             "document": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/templates")
-async def get_templates():
+async def get_templates(request: Request):
     """Get list of available document templates"""
-    generator = get_document_generator()
-    return {
-        "templates": generator.get_template_list(),
-        "total": len(generator.get_template_list())
-    }
+    return _static_response(request, _TEMPLATES_BYTES, _TEMPLATES_ETAG)
 
 # ============================================================================
 # SIMULATION ENDPOINTS
@@ -228,8 +367,9 @@ async def simulate_outcome(request: SimulationRequest):
     **Perfect for strategy planning!**
     """
     try:
-        engine = get_simulation_engine()
-        result = engine.simulate_outcome(
+        # BERT forwards run inside; keep the loop free for other requests
+        result = await asyncio.to_thread(
+            _SIMULATION.simulate_outcome,
             request.base_case,
             request.modifications
         )
@@ -250,8 +390,7 @@ async def sensitivity_analysis(request: SensitivityRequest):
     Shows which factors have the most influence on case outcome
     """
     try:
-        engine = get_simulation_engine()
-        result = engine.sensitivity_analysis(request.case_facts)
+        result = await asyncio.to_thread(_SIMULATION.sensitivity_analysis, request.case_facts)
         
         return {
             "status": "success",
@@ -265,6 +404,49 @@ async def sensitivity_analysis(request: SensitivityRequest):
 # DEMO ENDPOINTS (FOR JUDGES)
 # ============================================================================
 
+# Static shell of the complete-demo response; only the handful of fields
+# derived from the live service calls are filled in per request
+_DEMO_SKELETON = {
+    "status": "success",
+    "demo_features": {
+        "1_translation": {
+            "feature": "Multilingual Support",
+            "input": "मुझे जमानत चाहिए (Hindi)",
+            "output": None,
+            "languages_supported": 9
+        },
+        "2_simplification": {
+            "feature": "Plain Language Conversion",
+            "original": "habeas corpus petition under Article 226",
+            "simplified": "produce the person (bring before court) petition under Article 226",
+            "reading_level": "Grade 8"
+        },
+        "3_document_generation": {
+            "feature": "Legal Document Generator",
+            "document_type": "Bail Application",
+            "length": None,
+            "editable": None,
+            "preview": None
+        },
+        "4_simulation": {
+            "feature": "What-If Simulation",
+            "base_outcome": None,
+            "modified_outcome": None,
+            "outcome_changed": None,
+            "confidence_change": None
+        }
+    },
+    "total_features_demonstrated": 4,
+    "ai_models_used": [
+        "InLegalBERT (Bias Detection)",
+        "Google Translate (Multilingual)",
+        "GPT-based Document Generation",
+        "Simulation Engine"
+    ],
+    "timestamp": None
+}
+
+
 @app.get("/api/v1/demo/complete")
 async def complete_demo():
     """
@@ -273,74 +455,51 @@ async def complete_demo():
     Shows all capabilities in one response
     """
     
-    # 1. Translation
-    translation_service = get_translation_service()
-    translation_demo = translation_service.translate_query(
-        "मुझे जमानत चाहिए",
-        "hi",
-        "en"
-    )
-    
-    # 2. Simplification
-    simplification_demo = translation_service.simplify_legal_text(
-        "The appellant filed a habeas corpus petition under Article 226.",
-        "simple"
-    )
-    
-    # 3. Document Generation
-    doc_generator = get_document_generator()
-    doc_demo = doc_generator.generate_bail_application({
-        'applicant_name': 'Demo User',
-        'state': 'Demo State',
-        'first_time_offender': True
-    })
-    
-    # 4. Simulation
-    sim_engine = get_simulation_engine()
-    sim_demo = sim_engine.simulate_outcome(
-        {'facts': 'Accused has prior conviction. Witnesses unreliable.'},
-        {'remove_prior_conviction': True, 'improve_witness_credibility': True}
+    # The four feature demos are independent, so run them concurrently on
+    # the default thread pool: translation HTTP and torch inference both
+    # release the GIL, making wall time max() of the calls, not their sum
+    translation_demo, simplification_demo, doc_demo, sim_demo = await asyncio.gather(
+        # 1. Translation
+        asyncio.to_thread(
+            _TRANSLATION.translate_query,
+            "मुझे जमानत चाहिए",
+            "hi",
+            "en"
+        ),
+        # 2. Simplification
+        asyncio.to_thread(
+            _TRANSLATION.simplify_legal_text,
+            "The appellant filed a habeas corpus petition under Article 226.",
+            "simple"
+        ),
+        # 3. Document Generation
+        asyncio.to_thread(_GENERATOR.generate_bail_application, {
+            'applicant_name': 'Demo User',
+            'state': 'Demo State',
+            'first_time_offender': True
+        }),
+        # 4. Simulation
+        asyncio.to_thread(
+            _SIMULATION.simulate_outcome,
+            {'facts': 'Accused has prior conviction. Witnesses unreliable.'},
+            {'remove_prior_conviction': True, 'improve_witness_credibility': True}
+        ),
     )
     
-    return {
-        "status": "success",
-        "demo_features": {
-            "1_translation": {
-                "feature": "Multilingual Support",
-                "input": "मुझे जमानत चाहिए (Hindi)",
-                "output": translation_demo['translated_text'],
-                "languages_supported": 9
-            },
-            "2_simplification": {
-                "feature": "Plain Language Conversion",
-                "original": "habeas corpus petition under Article 226",
-                "simplified": "produce the person (bring before court) petition under Article 226",
-                "reading_level": "Grade 8"
-            },
-            "3_document_generation": {
-                "feature": "Legal Document Generator",
-                "document_type": "Bail Application",
-                "length": len(doc_demo['content']),
-                "editable": doc_demo['editable'],
-                "preview": doc_demo['content'][:300] + "..."
-            },
-            "4_simulation": {
-                "feature": "What-If Simulation",
-                "base_outcome": sim_demo['base_case']['prediction']['predictedOutcome'],
-                "modified_outcome": sim_demo['modified_case']['prediction']['predictedOutcome'],
-                "outcome_changed": sim_demo['impact_analysis']['outcome_changed'],
-                "confidence_change": f"{sim_demo['impact_analysis']['confidence_change_percent']}%"
-            }
-        },
-        "total_features_demonstrated": 4,
-        "ai_models_used": [
-            "InLegalBERT (Bias Detection)",
-            "Google Translate (Multilingual)",
-            "GPT-based Document Generation",
-            "Simulation Engine"
-        ],
-        "timestamp": datetime.now().isoformat()
-    }
+    response = copy.deepcopy(_DEMO_SKELETON)
+    features = response["demo_features"]
+    features["1_translation"]["output"] = translation_demo['translated_text']
+    doc_feature = features["3_document_generation"]
+    doc_feature["length"] = len(doc_demo['content'])
+    doc_feature["editable"] = doc_demo['editable']
+    doc_feature["preview"] = doc_demo['content'][:300] + "..."
+    sim_feature = features["4_simulation"]
+    sim_feature["base_outcome"] = sim_demo['base_case']['prediction']['predictedOutcome']
+    sim_feature["modified_outcome"] = sim_demo['modified_case']['prediction']['predictedOutcome']
+    sim_feature["outcome_changed"] = sim_demo['impact_analysis']['outcome_changed']
+    sim_feature["confidence_change"] = f"{sim_demo['impact_analysis']['confidence_change_percent']}%"
+    response["timestamp"] = datetime.now().isoformat()
+    return response
 
 # ============================================================================
 # STARTUP
@@ -348,6 +507,14 @@ async def complete_demo():
 
 @app.on_event("startup")
 async def startup_event():
+    # The service singletons are already bound at import time; run one
+    # dummy prediction so the model load and first forward happen before
+    # the server accepts traffic instead of inside the first demo request.
+    # A warmup failure is logged but never blocks boot.
+    try:
+        await asyncio.to_thread(_SIMULATION.ml_model.predict_outcome, "warmup", {})
+    except Exception as exc:
+        print(f"⚠️  Model warmup failed: {exc}")
     print("=" * 70)
     print("🚀 LEXAI HACKATHON DEMO API")
     print("=" * 70)
@@ -361,10 +528,25 @@ async def startup_event():
     print("=" * 70)
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "hackathon_api:app",
-        host="0.0.0.0",
-        port=8002,
-        reload=True
-    )
+    if os.getenv("ENV") == "dev":
+        # Hot reload is for local development only: the reloader forks a
+        # filesystem watcher and restricts the app to a single process
+        uvicorn.run(
+            "hackathon_api:app",
+            host="0.0.0.0",
+            port=8002,
+            reload=True
+        )
+    else:
+        # uvloop moves the event loop into libuv and httptools parses HTTP
+        # in C; both ship with uvicorn[standard], so request them outright
+        # instead of relying on auto-detection
+        uvicorn.run(
+            "hackathon_api:app",
+            host="0.0.0.0",
+            port=8002,
+            loop="uvloop",
+            http="httptools",
+            workers=min(4, os.cpu_count() or 1)
+        )
 
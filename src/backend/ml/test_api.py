@@ -6,16 +6,6 @@ Run tests with: pytest test_api.py -v
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from fastapi.testclient import TestClient
-from api import app
-
-client = TestClient(app)
 
 # ============================================================================
 # TEST DATA
@@ -73,14 +63,14 @@ SAMPLE_HISTORICAL_CASES = [
 class TestHealthEndpoints:
     """Test basic API health and info endpoints"""
     
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         response = client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["service"] == "InLegalBERT Analysis API"
         assert data["status"] == "operational"
     
-    def test_model_info(self):
+    def test_model_info(self, client):
         response = client.get("/api/v1/model/info")
         assert response.status_code == 200
         data = response.json()
@@ -92,7 +82,7 @@ class TestHealthEndpoints:
 class TestDocumentBiasAnalysis:
     """Test document bias detection"""
     
-    def test_basic_bias_detection(self):
+    def test_basic_bias_detection(self, client):
         response = client.post(
             "/api/v1/analyze/document-bias",
             json={
@@ -107,7 +97,7 @@ class TestDocumentBiasAnalysis:
         assert "biasFlags_text" in data["results"]
         assert "bias_scores" in data["results"]
     
-    def test_bias_threshold(self):
+    def test_bias_threshold(self, client):
         # High threshold should detect fewer biases
         response_high = client.post(
             "/api/v1/analyze/document-bias",
@@ -131,7 +121,7 @@ class TestDocumentBiasAnalysis:
         
         assert low_flags >= high_flags
     
-    def test_empty_text_handling(self):
+    def test_empty_text_handling(self, client):
         response = client.post(
             "/api/v1/analyze/document-bias",
             json={
@@ -146,7 +136,7 @@ class TestDocumentBiasAnalysis:
 class TestRAGBiasAnalysis:
     """Test RAG output bias detection"""
     
-    def test_rag_bias_detection(self):
+    def test_rag_bias_detection(self, client):
         response = client.post(
             "/api/v1/analyze/rag-bias",
             json={
@@ -160,7 +150,7 @@ class TestRAGBiasAnalysis:
         assert "results" in data
         assert "biasFlags_output" in data["results"]
     
-    def test_rag_interpretive_bias(self):
+    def test_rag_interpretive_bias(self, client):
         # Summary with interpretive language should be flagged
         subjective_summary = "Clearly the defendant is obviously guilty without a doubt."
         response = client.post(
@@ -178,7 +168,7 @@ class TestRAGBiasAnalysis:
 class TestSystemicBiasAnalysis:
     """Test systemic bias detection"""
     
-    def test_systemic_bias_detection(self):
+    def test_systemic_bias_detection(self, client):
         response = client.post(
             "/api/v1/analyze/systemic-bias",
             json={
@@ -191,7 +181,7 @@ class TestSystemicBiasAnalysis:
         assert "results" in data
         assert "biasDashboardData" in data["results"]
     
-    def test_dashboard_data_structure(self):
+    def test_dashboard_data_structure(self, client):
         response = client.post(
             "/api/v1/analyze/systemic-bias",
             json={
@@ -205,7 +195,7 @@ class TestSystemicBiasAnalysis:
         assert "regional_analysis" in dashboard
         assert "chart_data" in dashboard["gender_analysis"]
     
-    def test_empty_historical_cases(self):
+    def test_empty_historical_cases(self, client):
         response = client.post(
             "/api/v1/analyze/systemic-bias",
             json={
@@ -220,7 +210,7 @@ class TestSystemicBiasAnalysis:
 class TestOutcomePrediction:
     """Test legal outcome prediction"""
     
-    def test_basic_prediction(self):
+    def test_basic_prediction(self, client):
         response = client.post(
             "/api/v1/predict/outcome",
             json={
@@ -238,7 +228,7 @@ class TestOutcomePrediction:
         assert "predictedOutcome" in data["results"]
         assert "confidenceScore" in data["results"]
     
-    def test_confidence_score_range(self):
+    def test_confidence_score_range(self, client):
         response = client.post(
             "/api/v1/predict/outcome",
             json={
@@ -248,7 +238,7 @@ class TestOutcomePrediction:
         confidence = response.json()["results"]["confidenceScore"]
         assert 0.0 <= confidence <= 1.0
     
-    def test_confidence_level_categorization(self):
+    def test_confidence_level_categorization(self, client):
         response = client.post(
             "/api/v1/predict/outcome",
             json={
@@ -258,7 +248,7 @@ class TestOutcomePrediction:
         level = response.json()["results"]["confidenceLevel"]
         assert level in ["low", "medium", "high"]
     
-    def test_bail_case_prediction(self):
+    def test_bail_case_prediction(self, client):
         bail_text = """
         Bail application for fraud case. Petitioner has no prior criminal record,
         deep community roots, and is willing to cooperate. No flight risk evident.
@@ -280,7 +270,7 @@ class TestOutcomePrediction:
 class TestComprehensiveAnalysis:
     """Test comprehensive analysis endpoint"""
     
-    def test_full_analysis(self):
+    def test_full_analysis(self, client):
         response = client.post(
             "/api/v1/analyze/comprehensive",
             json={
@@ -303,7 +293,7 @@ class TestComprehensiveAnalysis:
         assert "systemic_bias" in data
         assert "outcome_prediction" in data
     
-    def test_partial_analysis(self):
+    def test_partial_analysis(self, client):
         # Test with only case_text (minimum requirement)
         response = client.post(
             "/api/v1/analyze/comprehensive",
@@ -321,7 +311,7 @@ class TestComprehensiveAnalysis:
         assert "rag_bias" not in data or data["rag_bias"] is None
         assert "systemic_bias" not in data or data["systemic_bias"] is None
     
-    def test_analysis_id_generation(self):
+    def test_analysis_id_generation(self, client):
         response = client.post(
             "/api/v1/analyze/comprehensive",
             json={
@@ -332,7 +322,7 @@ class TestComprehensiveAnalysis:
         assert "analysis_id" in data
         assert data["analysis_id"].startswith("analysis_")
     
-    def test_timestamp_inclusion(self):
+    def test_timestamp_inclusion(self, client):
         response = client.post(
             "/api/v1/analyze/comprehensive",
             json={
@@ -349,7 +339,7 @@ class TestComprehensiveAnalysis:
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
-    def test_invalid_json(self):
+    def test_invalid_json(self, client):
         response = client.post(
             "/api/v1/analyze/comprehensive",
             data="invalid json",
@@ -357,14 +347,14 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
     
-    def test_missing_required_field(self):
+    def test_missing_required_field(self, client):
         response = client.post(
             "/api/v1/analyze/comprehensive",
             json={}
         )
         assert response.status_code == 422
     
-    def test_invalid_threshold(self):
+    def test_invalid_threshold(self, client):
         response = client.post(
             "/api/v1/analyze/document-bias",
             json={
@@ -374,7 +364,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
     
-    def test_very_long_text(self):
+    def test_very_long_text(self, client):
         # Test with text longer than model's max length
         long_text = "This is a test. " * 1000
         response = client.post(
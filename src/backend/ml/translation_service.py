@@ -6,8 +6,10 @@ Quick MVP implementation for hackathon demo
 Supports translation between English and Indian regional languages
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from googletrans import Translator
+import httpx
 import re
 
 class MultilingualService:
@@ -28,8 +30,50 @@ class MultilingualService:
         'ml': 'Malayalam',
     }
     
+    # Legal term mappings (MVP - can be expanded); fused below into one
+    # alternation so simplification is a single pass over the text
+    _SIMPLIFICATION_RULES = (
+            (r'\binter alia\b', 'among other things'),
+            (r'\bres ipsa loquitur\b', 'the thing speaks for itself'),
+            (r'\bper se\b', 'by itself'),
+            (r'\bpro bono\b', 'for free'),
+            (r'\bhabeas corpus\b', 'produce the person (bring before court)'),
+            (r'\bbail\b', 'temporary release from custody'),
+            (r'\bFIR\b', 'First Information Report (initial police complaint)'),
+            (r'\bIPC\b', 'Indian Penal Code (criminal law)'),
+            (r'\bCrPC\b', 'Criminal Procedure Code (how criminal cases work)'),
+            (r'\bappellant\b', 'person appealing the decision'),
+            (r'\brespondent\b', 'person responding to appeal'),
+            (r'\bpetitioner\b', 'person filing the case'),
+            (r'\bdefendant\b', 'person accused/sued'),
+            (r'\bplaintiff\b', 'person filing complaint'),
+            (r'\bbeyond reasonable doubt\b', 'very certain, no significant doubts'),
+            (r'\bprecedent\b', 'previous similar case decision'),
+            (r'\bjurisdiction\b', 'legal authority/area of court'),
+            (r'\bconviction\b', 'found guilty'),
+            (r'\bacquittal\b', 'found not guilty'),
+    )
+    # One combined pattern with a named group per rule; the sub callback
+    # dispatches on the matched group index instead of walking the text
+    # once per rule
+    _SIMPLIFY_PATTERN = re.compile(
+        "|".join(
+            f"(?P<t{i}>{pattern})"
+            for i, (pattern, _) in enumerate(_SIMPLIFICATION_RULES)
+        ),
+        re.IGNORECASE,
+    )
+    _SIMPLIFY_REPLACEMENTS = tuple(
+        replacement for _, replacement in _SIMPLIFICATION_RULES
+    )
+    
     def __init__(self):
-        self.translator = Translator()
+        # googletrans holds one persistent httpx.Client (HTTP/2 + keep-alive)
+        # per Translator, and this service is a process-wide singleton, so all
+        # requests share pooled connections instead of paying a TCP/TLS
+        # handshake each call. The explicit timeout stops a stuck upstream
+        # from pinning worker threads indefinitely.
+        self.translator = Translator(timeout=httpx.Timeout(10.0))
         
     def detect_language(self, text: str) -> str:
         """Auto-detect language of input text"""
@@ -52,13 +96,15 @@ class MultilingualService:
             Dict with translated text and metadata
         """
         try:
-            # Auto-detect if needed
+            # googletrans detects the source during translation and reports
+            # it on result.src, so 'auto' costs one round trip, not a
+            # detect call followed by a translate call
             if source_lang == 'auto':
-                source_lang = self.detect_language(text)
-            
-            # Translate
-            result = self.translator.translate(text, src=source_lang, dest=target_lang)
-            
+                result = self.translator.translate(text, dest=target_lang)
+                source_lang = result.src
+            else:
+                result = self.translator.translate(text, src=source_lang, dest=target_lang)
+
             return {
                 "original_text": text,
                 "translated_text": result.text,
@@ -76,6 +122,48 @@ class MultilingualService:
                 "target_language": target_lang
             }
     
+    def translate_batch(self, texts, source_lang: str = 'auto', target_lang: str = 'en'):
+        """
+        Translate several queries in one upstream call
+
+        googletrans accepts a list natively, so N concurrent requests cost one
+        round trip instead of N. Results match translate_query's shape.
+
+        Args:
+            texts: List of texts to translate
+            source_lang: Shared source language code ('auto' to detect each)
+            target_lang: Shared target language
+
+        Returns:
+            List of dicts, one per input text
+        """
+        try:
+            results = self.translator.translate(texts, src=source_lang, dest=target_lang)
+            if not isinstance(results, list):
+                results = [results]
+            return [
+                {
+                    "original_text": text,
+                    "translated_text": result.text,
+                    "source_language": result.src,
+                    "source_language_name": self.LANGUAGES.get(result.src, "Unknown"),
+                    "target_language": target_lang,
+                    "confidence": 0.95  # Mock confidence for demo
+                }
+                for text, result in zip(texts, results)
+            ]
+        except Exception as e:
+            return [
+                {
+                    "error": str(e),
+                    "original_text": text,
+                    "translated_text": text,  # Fallback to original
+                    "source_language": source_lang,
+                    "target_language": target_lang
+                }
+                for text in texts
+            ]
+
     def translate_response(self, text: str, target_lang: str = 'hi') -> Dict[str, Any]:
         """
         Translate AI response to user's preferred language
@@ -128,34 +216,11 @@ class MultilingualService:
             Simplified text with explanations
         """
         
-        # Legal term mappings (MVP - can be expanded)
-        legal_simplifications = {
-            r'\binter alia\b': 'among other things',
-            r'\bres ipsa loquitur\b': 'the thing speaks for itself',
-            r'\bper se\b': 'by itself',
-            r'\bpro bono\b': 'for free',
-            r'\bhabeas corpus\b': 'produce the person (bring before court)',
-            r'\bbail\b': 'temporary release from custody',
-            r'\bFIR\b': 'First Information Report (initial police complaint)',
-            r'\bIPC\b': 'Indian Penal Code (criminal law)',
-            r'\bCrPC\b': 'Criminal Procedure Code (how criminal cases work)',
-            r'\bappellant\b': 'person appealing the decision',
-            r'\brespondent\b': 'person responding to appeal',
-            r'\bpetitioner\b': 'person filing the case',
-            r'\bdefendant\b': 'person accused/sued',
-            r'\bplaintiff\b': 'person filing complaint',
-            r'\bbeyond reasonable doubt\b': 'very certain, no significant doubts',
-            r'\bprecedent\b': 'previous similar case decision',
-            r'\bjurisdiction\b': 'legal authority/area of court',
-            r'\bconviction\b': 'found guilty',
-            r'\bacquittal\b': 'found not guilty',
-        }
-        
-        simplified = legal_text
-        
-        # Apply simplifications
-        for pattern, replacement in legal_simplifications.items():
-            simplified = re.sub(pattern, replacement, simplified, flags=re.IGNORECASE)
+        # Apply all simplifications in one pass
+        replacements = self._SIMPLIFY_REPLACEMENTS
+        simplified = self._SIMPLIFY_PATTERN.sub(
+            lambda match: replacements[int(match.lastgroup[1:])], legal_text
+        )
         
         # Extract key points (simple sentence extraction)
         sentences = simplified.split('.')
@@ -166,20 +231,15 @@ class MultilingualService:
             "simplified_text": simplified,
             "reading_level": reading_level,
             "key_points": key_points,
-            "legal_terms_explained": list(legal_simplifications.values())[:10],
+            "legal_terms_explained": list(self._SIMPLIFY_REPLACEMENTS[:10]),
             "summary": f"This text explains legal matters in simpler terms. {len(key_points)} key points identified."
         }
 
 
-# Global instance
-_translation_service = None
-
+@lru_cache(maxsize=1)
 def get_translation_service() -> MultilingualService:
-    """Get or create translation service instance"""
-    global _translation_service
-    if _translation_service is None:
-        _translation_service = MultilingualService()
-    return _translation_service
+    """Get or create translation service instance (process-wide singleton)"""
+    return MultilingualService()
 
 
 # Quick test